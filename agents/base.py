@@ -4,16 +4,299 @@ Base strategic agent using OpenAI (gpt-4o).
 
 import os
 import json
+import time
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
-from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Literal, Optional
+from dataclasses import dataclass
 
-from openai import OpenAI
+from pydantic import BaseModel, ValidationError
 
 from engine.turn import Orders
 
+from .cache import SemanticOrdersCache, ResponseCache
+from .client import get_client, get_async_client
+
+
+# Situation reports carry the full friendly roster on the first turn and every
+# FULL_SNAPSHOT_INTERVAL turns after; in between only changed units are listed,
+# unless more than DELTA_MAX_CHANGES units changed.
+FULL_SNAPSHOT_INTERVAL = 4
+DELTA_MAX_CHANGES = 15
+
+# Turns always planned with the full model, however quiet the situation looks
+PIVOTAL_TURNS = frozenset({1, 4, 8})
+
+# Unit type keyword -> briefing category, in match priority order (first hit wins)
+_CATEGORY_KEYWORDS = tuple(
+    (keyword, category)
+    for category, keywords in (
+        ('aircraft', ('rafale', 'su30', 'mig', 'mirage', 'f16', 'jf17', 'j10', 'jaguar', 'tejas')),
+        ('missile', ('brahmos', 'nirbhay', 'pralay', 'babur', 'raad', 'shaheen', 'ghaznavi')),
+        ('air_defense', ('s400', 'akash', 'spyder', 'mrsam', 'hq9', 'hq16', 'spada')),
+        ('artillery', ('pinaka', 'smerch', 'm777', 'dhanush', 'k9', 'a100')),
+        ('helicopter', ('apache', 'lch', 'rudra', 'chinook', 'cobra', 't129', 'z10', 'mi17')),
+        ('drone', ('heron', 'harop', 'mq9', 'wing_loong', 'burraq', 'shahpar')),
+        ('ground', ('corps', 'division', 'brigade', 'infantry', 'armor', 'mech', 'mountain')),
+        ('special_forces', ('para_sf', 'marcos', 'garud', 'ssg', 'zarrar')),
+        ('isr', ('awacs', 'phalcon', 'netra', 'erieye')),
+    )
+    for keyword in keywords
+)
+
+# Briefing category order
+UNIT_CATEGORIES = (
+    'aircraft', 'missile', 'air_defense', 'artillery', 'helicopter',
+    'drone', 'ground', 'special_forces', 'isr', 'other',
+)
+
+
+@lru_cache(maxsize=None)
+def _categorize_unit_type(unit_type: str) -> str:
+    """Map a unit type to its briefing category (memoized per raw type string)."""
+    unit_type = unit_type.lower()
+    for keyword, category in _CATEGORY_KEYWORDS:
+        if keyword in unit_type:
+            return category
+    return 'other'
+
+
+# Roster line for one friendly unit; missing fields fall back to the defaults
+_UNIT_LINE = "  - ID: `{id}` | Type: {type} | Strength: {strength} | Status: {status}\n".format_map
+_UNIT_LINE_DEFAULTS = {'type': 'N/A', 'strength': 'N/A', 'status': 'ready'}
+
+
+def _format_unit_line(unit: dict) -> str:
+    """Render one roster line from a unit dict."""
+    return _UNIT_LINE({**_UNIT_LINE_DEFAULTS, **unit})
+
+
+# Closing section of every situation report
+_ORDERS_REQUIRED = (
+    "\n### ORDERS REQUIRED\n"
+    "Issue orders for all domains: missiles, EW, air, drones, artillery, helicopters, ground, special forces.\n"
+    "Consider: current objectives, enemy disposition, weather, supply status.\n"
+    "IMPORTANT: For missile strikes, fire 2-4 missiles per salvo against high-value targets (airbases, C2, SAM sites) to ensure kill probability. Single-missile strikes often miss.\n"
+)
+
+# Instructions for folding old turns into the PRIOR TURNS SUMMARY message
+_SUMMARY_INSTRUCTIONS = (
+    "Summarize these earlier turns of a wargame for the commander who issued them. "
+    "Keep unit IDs, losses, territory changes, VP trends, key enemy contacts and "
+    "the commander's standing intent. Be concise; bullet points are fine."
+)
+
+# JSON schema for structured orders output. Built once at import so every
+# request carries byte-identical schema bytes; treat as read-only.
+_ORDERS_SCHEMA = {
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {
+        "reasoning": {
+            "type": "string",
+            "description": "Brief explanation of strategic reasoning for this turn"
+        },
+        "missile_strikes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "properties": {
+                    "battery_id": {"type": "string"},
+                    "target_id": {"type": "string"},
+                    "target_type": {"type": "string", "enum": ["airbase", "sam_site", "radar", "c2", "logistics", "ground_unit"]},
+                    "missiles": {"type": "integer", "description": "Number of missiles to fire (recommend 2-4 per target for high-value targets to ensure kill)"}
+                },
+                "required": ["battery_id", "target_id", "target_type", "missiles"]
+            }
+        },
+        "ew_missions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "properties": {
+                    "unit_id": {"type": "string"},
+                    "mission_type": {"type": "string", "enum": ["jam_radar", "jam_comms", "gps_denial", "cyber", "sigint"]}
+                },
+                "required": ["unit_id", "mission_type"]
+            }
+        },
+        "air_missions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "properties": {
+                    "squadron_id": {"type": "string"},
+                    "mission_type": {"type": "string", "enum": ["cap", "sweep", "strike", "sead", "cas"]},
+                    "target_id": {"type": "string"},
+                    "aircraft": {"type": "integer"}
+                },
+                "required": ["squadron_id", "mission_type", "target_id", "aircraft"]
+            }
+        },
+        "drone_missions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "properties": {
+                    "unit_id": {"type": "string"},
+                    "mission_type": {"type": "string", "enum": ["isr", "strike", "sead", "loitering"]},
+                    "target_id": {"type": "string"}
+                },
+                "required": ["unit_id", "mission_type", "target_id"]
+            }
+        },
+        "artillery_missions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "properties": {
+                    "battery_id": {"type": "string"},
+                    "target_id": {"type": "string"},
+                    "rounds": {"type": "integer"},
+                    "mission_type": {"type": "string", "enum": ["bombardment", "suppression", "counter_battery", "smoke"]}
+                },
+                "required": ["battery_id", "target_id", "rounds", "mission_type"]
+            }
+        },
+        "helicopter_missions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "properties": {
+                    "unit_id": {"type": "string"},
+                    "mission_type": {"type": "string", "enum": ["attack", "cas", "air_assault", "scout", "csar"]},
+                    "target_id": {"type": "string"},
+                    "helicopters": {"type": "integer"}
+                },
+                "required": ["unit_id", "mission_type", "target_id", "helicopters"]
+            }
+        },
+        "ground_orders": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "properties": {
+                    "unit_id": {"type": "string"},
+                    "action": {"type": "string", "enum": ["attack", "defend", "move", "withdraw", "reserve"]},
+                    "target_id": {"type": "string"},
+                    "posture": {"type": "string", "enum": ["assault", "probe", "exploitation", "defend", "delay"]}
+                },
+                "required": ["unit_id", "action", "target_id", "posture"]
+            }
+        },
+        "sf_missions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "properties": {
+                    "unit_id": {"type": "string"},
+                    "mission_type": {"type": "string", "enum": ["raid", "recon", "sabotage", "da", "sr"]},
+                    "target_id": {"type": "string"}
+                },
+                "required": ["unit_id", "mission_type", "target_id"]
+            }
+        }
+    },
+    "required": ["reasoning", "missile_strikes", "ew_missions", "air_missions", "drone_missions", "artillery_missions", "helicopter_missions", "ground_orders", "sf_missions"]
+}
+
+
+def _response_format(schema: dict) -> dict:
+    """Wrap an orders schema in the structured-output response_format envelope."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "military_orders",
+            "schema": schema,
+            "strict": True
+        }
+    }
+
+
+# Built once and passed by identity on every request
+_RESPONSE_FORMAT = _response_format(_ORDERS_SCHEMA)
+
+
+class MissileStrikeOrder(BaseModel):
+    battery_id: str
+    target_id: str
+    target_type: Literal["airbase", "sam_site", "radar", "c2", "logistics", "ground_unit"]
+    missiles: int
+
+
+class EWMissionOrder(BaseModel):
+    unit_id: str
+    mission_type: Literal["jam_radar", "jam_comms", "gps_denial", "cyber", "sigint"]
+
+
+class AirMissionOrder(BaseModel):
+    squadron_id: str
+    mission_type: Literal["cap", "sweep", "strike", "sead", "cas"]
+    target_id: str
+    aircraft: int
+
+
+class DroneMissionOrder(BaseModel):
+    unit_id: str
+    mission_type: Literal["isr", "strike", "sead", "loitering"]
+    target_id: str
+
+
+class ArtilleryMissionOrder(BaseModel):
+    battery_id: str
+    target_id: str
+    rounds: int
+    mission_type: Literal["bombardment", "suppression", "counter_battery", "smoke"]
+
 
-@dataclass
+class HelicopterMissionOrder(BaseModel):
+    unit_id: str
+    mission_type: Literal["attack", "cas", "air_assault", "scout", "csar"]
+    target_id: str
+    helicopters: int
+
+
+class GroundOrder(BaseModel):
+    unit_id: str
+    action: Literal["attack", "defend", "move", "withdraw", "reserve"]
+    target_id: str
+    posture: Literal["assault", "probe", "exploitation", "defend", "delay"]
+
+
+class SFMissionOrder(BaseModel):
+    unit_id: str
+    mission_type: Literal["raid", "recon", "sabotage", "da", "sr"]
+    target_id: str
+
+
+class MilitaryOrders(BaseModel):
+    """Typed mirror of _ORDERS_SCHEMA, used to decode and validate responses.
+
+    The request still sends the prebuilt _ORDERS_SCHEMA dict rather than
+    passing this model to chat.completions.parse, which would regenerate the
+    strict JSON schema from the model on every call.
+    """
+    reasoning: str = ""
+    missile_strikes: list[MissileStrikeOrder] = []
+    ew_missions: list[EWMissionOrder] = []
+    air_missions: list[AirMissionOrder] = []
+    drone_missions: list[DroneMissionOrder] = []
+    artillery_missions: list[ArtilleryMissionOrder] = []
+    helicopter_missions: list[HelicopterMissionOrder] = []
+    ground_orders: list[GroundOrder] = []
+    sf_missions: list[SFMissionOrder] = []
+
+
+@dataclass(slots=True, frozen=True)
 class AgentConfig:
     """Configuration for a strategic agent."""
     faction: str
@@ -21,10 +304,31 @@ class AgentConfig:
     risk_tolerance: float = 0.5
     air_priority: str = "balanced"
     ground_priority: str = "balanced"
-    constraints: list[str] = field(default_factory=list)
+    constraints: tuple[str, ...] = ()
     model: str = "gpt-4o"
     temperature: float = 0.7
     max_tokens: int = 4096
+    stream: bool = True
+    # False sends only the system prompt and the current briefing each turn;
+    # prior turns reach the model only through the briefing itself
+    send_history: bool = True
+    # Older turns are folded into a summary, keeping this many verbatim
+    history_keep_turns: int = 4
+    summary_model: str = "gpt-4o-mini"
+    # Quiet turns (complexity below the threshold) are planned with this model,
+    # e.g. "gpt-4o-mini"; None (the default) always uses model
+    fast_model: Optional[str] = None
+    fast_model_threshold: int = 8
+    # Reuse orders for near-identical situation briefings (embedding similarity)
+    semantic_cache: bool = False
+    semantic_cache_threshold: float = 0.92
+    semantic_cache_path: Optional[str] = None
+    # Reuse orders for identical queries, persisted across runs
+    response_cache: bool = False
+    response_cache_dir: Optional[str] = None  # default ~/.wargame/cache
+    # Hold positions without planning on turns with no known enemy contacts
+    # (the opening turn is always planned)
+    hold_when_blind: bool = False
 
 
 class StrategicAgent(ABC):
@@ -33,9 +337,30 @@ class StrategicAgent(ABC):
     def __init__(self, config: AgentConfig):
         self.config = config
         self.faction = config.faction
-        self.client = OpenAI()  # Uses OPENAI_API_KEY env var
+        # Shared across agents so both reuse one connection pool
+        self.client = get_client()
+        # Append-only: prior messages are never edited so the system prompt
+        # plus earlier turns form a stable prefix for OpenAI prompt caching.
+        # Only reset() and periodic compaction of old turns rewrite it.
         self.conversation_history: list[dict] = []
         self.turn_count = 0
+        # Last briefed game state, for delta-encoded situation reports
+        self._prev_state: Optional[dict] = None
+        self._last_reasoning: Optional[str] = None
+        self._last_diff: Optional[dict] = None
+        # Whether the last turn's orders came from a cache instead of the LLM
+        self.cache_hit = False
+
+        self.response_cache: Optional[ResponseCache] = None
+        if config.response_cache:
+            self.response_cache = ResponseCache(config.response_cache_dir)
+
+        self.orders_cache: Optional[SemanticOrdersCache] = None
+        if config.semantic_cache:
+            self.orders_cache = SemanticOrdersCache(
+                threshold=config.semantic_cache_threshold,
+                path=config.semantic_cache_path,
+            )
 
     @property
     @abstractmethod
@@ -44,131 +369,143 @@ class StrategicAgent(ABC):
         pass
 
     @property
-    def orders_schema(self) -> dict:
-        """JSON schema for structured orders output."""
-        return {
-            "type": "object",
-            "additionalProperties": False,
-            "properties": {
-                "reasoning": {
-                    "type": "string",
-                    "description": "Brief explanation of strategic reasoning for this turn"
-                },
-                "missile_strikes": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "additionalProperties": False,
-                        "properties": {
-                            "battery_id": {"type": "string"},
-                            "target_id": {"type": "string"},
-                            "target_type": {"type": "string", "enum": ["airbase", "sam_site", "radar", "c2", "logistics", "ground_unit"]},
-                            "missiles": {"type": "integer", "description": "Number of missiles to fire (recommend 2-4 per target for high-value targets to ensure kill)"}
-                        },
-                        "required": ["battery_id", "target_id", "target_type", "missiles"]
-                    }
-                },
-                "ew_missions": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "additionalProperties": False,
-                        "properties": {
-                            "unit_id": {"type": "string"},
-                            "mission_type": {"type": "string", "enum": ["jam_radar", "jam_comms", "gps_denial", "cyber", "sigint"]}
-                        },
-                        "required": ["unit_id", "mission_type"]
-                    }
-                },
-                "air_missions": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "additionalProperties": False,
-                        "properties": {
-                            "squadron_id": {"type": "string"},
-                            "mission_type": {"type": "string", "enum": ["cap", "sweep", "escort", "strike", "sead", "cas"]},
-                            "target_id": {"type": "string"},
-                            "aircraft": {"type": "integer"}
-                        },
-                        "required": ["squadron_id", "mission_type", "target_id", "aircraft"]
-                    }
-                },
-                "drone_missions": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "additionalProperties": False,
-                        "properties": {
-                            "unit_id": {"type": "string"},
-                            "mission_type": {"type": "string", "enum": ["isr", "strike", "sead", "loitering"]},
-                            "target_id": {"type": "string"}
-                        },
-                        "required": ["unit_id", "mission_type", "target_id"]
-                    }
-                },
-                "artillery_missions": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "additionalProperties": False,
-                        "properties": {
-                            "battery_id": {"type": "string"},
-                            "target_id": {"type": "string"},
-                            "rounds": {"type": "integer"},
-                            "mission_type": {"type": "string", "enum": ["bombardment", "suppression", "counter_battery", "smoke"]}
-                        },
-                        "required": ["battery_id", "target_id", "rounds", "mission_type"]
-                    }
-                },
-                "helicopter_missions": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "additionalProperties": False,
-                        "properties": {
-                            "unit_id": {"type": "string"},
-                            "mission_type": {"type": "string", "enum": ["attack", "cas", "air_assault", "scout", "csar"]},
-                            "target_id": {"type": "string"},
-                            "helicopters": {"type": "integer"}
-                        },
-                        "required": ["unit_id", "mission_type", "target_id", "helicopters"]
-                    }
-                },
-                "ground_orders": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "additionalProperties": False,
-                        "properties": {
-                            "unit_id": {"type": "string"},
-                            "action": {"type": "string", "enum": ["attack", "defend", "move", "withdraw", "reserve"]},
-                            "target_id": {"type": "string"},
-                            "posture": {"type": "string", "enum": ["assault", "probe", "exploitation", "defend", "delay"]}
-                        },
-                        "required": ["unit_id", "action", "target_id", "posture"]
-                    }
-                },
-                "sf_missions": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "additionalProperties": False,
-                        "properties": {
-                            "unit_id": {"type": "string"},
-                            "mission_type": {"type": "string", "enum": ["raid", "recon", "sabotage", "da", "sr"]},
-                            "target_id": {"type": "string"}
-                        },
-                        "required": ["unit_id", "mission_type", "target_id"]
-                    }
-                }
-            },
-            "required": ["reasoning", "missile_strikes", "ew_missions", "air_missions", "drone_missions", "artillery_missions", "helicopter_missions", "ground_orders", "sf_missions"]
-        }
+    def async_client(self):
+        """The shared async client, looked up per call since it is recreated per event loop."""
+        return get_async_client()
+
+    # JSON schema for structured orders output, shared by identity across turns
+    orders_schema = _ORDERS_SCHEMA
+    response_format = _RESPONSE_FORMAT
+
+    def generate_orders(self, game_state: dict, previous_reports: list = None, cache: bool = True) -> Orders:
+        """Generate orders for the current turn based on game state.
+
+        cache=False bypasses the response and semantic caches for this turn.
+        """
+        orders = self._plan_orders(game_state, previous_reports, cache)
+        self._fold_history()
+        return orders
+
+    async def agenerate_orders(self, game_state: dict, previous_reports: list = None, cache: bool = True) -> Orders:
+        """Async variant of generate_orders, so both agents can plan concurrently."""
+        orders = await self._aplan_orders(game_state, previous_reports, cache)
+        await self._afold_history()
+        return orders
+
+    def _plan_orders(self, game_state: dict, previous_reports: list = None, cache: bool = True) -> Orders:
+        """Answer the turn from a cache or the model, recording it in the history."""
+        situation_prompt = self._begin_turn(game_state, previous_reports)
+
+        # Identical query answered before: replay its response
+        key = None
+        if cache and self.response_cache is not None:
+            key = self.response_cache.key(self.system_prompt, game_state, previous_reports)
+            cached_text = self.response_cache.get(key)
+            if cached_text is not None:
+                return self._replay_orders(cached_text)
+
+        # Near-identical briefing seen before: reuse its orders, skip the LLM
+        embedding = None
+        if cache and self.orders_cache is not None:
+            embedding = self.orders_cache.embed(self.client, situation_prompt)
+            cached = self._cached_orders(embedding)
+            if cached is not None:
+                return cached
+
+        model = self._route_model(game_state)
+        response_text = self._request_orders(model)
+        try:
+            orders = self._finish_turn(response_text, embedding, key)
+        except ValidationError:
+            if model == self.config.model:
+                raise
+            # The fast model produced invalid orders; retry once with the full one
+            orders = self._finish_turn(self._request_orders(self.config.model), embedding, key)
+
+        return orders
+
+    async def _aplan_orders(self, game_state: dict, previous_reports: list = None, cache: bool = True) -> Orders:
+        """Async variant of _plan_orders."""
+        situation_prompt = self._begin_turn(game_state, previous_reports)
+
+        key = None
+        if cache and self.response_cache is not None:
+            key = self.response_cache.key(self.system_prompt, game_state, previous_reports)
+            cached_text = self.response_cache.get(key)
+            if cached_text is not None:
+                return self._replay_orders(cached_text)
+
+        embedding = None
+        if cache and self.orders_cache is not None:
+            embedding = await self.orders_cache.aembed(self.async_client, situation_prompt)
+            cached = self._cached_orders(embedding)
+            if cached is not None:
+                return cached
+
+        model = self._route_model(game_state)
+
+        # Compaction only summarizes turns older than this one, so run it
+        # alongside the orders completion instead of after it
+        overflow = self._history_overflow(pending=1)
+        if overflow:
+            response_text, summary = await asyncio.gather(
+                self._arequest_orders(model),
+                self.async_client.chat.completions.create(**self._summary_request(overflow)),
+            )
+        else:
+            response_text = await self._arequest_orders(model)
+
+        try:
+            orders = self._finish_turn(response_text, embedding, key)
+        except ValidationError:
+            if model == self.config.model:
+                raise
+            orders = self._finish_turn(await self._arequest_orders(self.config.model), embedding, key)
+
+        if overflow:
+            self._compact_history(overflow, summary.choices[0].message.content)
+
+        return orders
+
+    def generate_orders_batch(
+        self,
+        game_states: list[dict],
+        previous_reports: list = None,
+        poll_interval: float = 30.0,
+    ) -> list[Orders]:
+        """Generate orders for many independent game states via the Batch API.
+
+        For offline runs (replays, parameter sweeps) where no human is waiting:
+        the Batch API costs half as much as live completions. Each state is
+        briefed standalone with a full roster and no conversation history, and
+        the agent's live turn state is left untouched. Blocks until the batch
+        finishes.
+        """
+        return batch_generate_orders(
+            [(self, game_state, previous_reports) for game_state in game_states],
+            poll_interval,
+        )
 
-    def generate_orders(self, game_state: dict, previous_reports: list = None) -> Orders:
-        """Generate orders for the current turn based on game state."""
+    def _batch_body(self, game_state: dict, previous_reports: list = None) -> dict:
+        """Build a standalone Batch API request body for one game state."""
+        saved_prev_state, saved_diff = self._prev_state, self._last_diff
+        try:
+            self._prev_state = None  # full snapshot, no delta
+            messages = [
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": self._build_situation_prompt(game_state, previous_reports)},
+            ]
+        finally:
+            self._prev_state, self._last_diff = saved_prev_state, saved_diff
+        body = self._completion_request(messages)
+        del body["stream"]
+        return body
+
+    def _begin_turn(self, game_state: dict, previous_reports: list = None) -> str:
+        """Advance the turn counter and record the situation briefing."""
         self.turn_count += 1
+        self._last_reasoning = None
+        self.cache_hit = False
 
         # Build the prompt with current situation
         situation_prompt = self._build_situation_prompt(game_state, previous_reports)
@@ -178,29 +515,92 @@ class StrategicAgent(ABC):
             "role": "user",
             "content": situation_prompt
         })
-
-        # Call GPT-5.2 with structured output
-        response = self.client.chat.completions.create(
-            model=self.config.model,
-            messages=[
-                {"role": "system", "content": self.system_prompt},
-                *self.conversation_history
-            ],
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "military_orders",
-                    "schema": self.orders_schema,
-                    "strict": True
-                }
-            },
-            temperature=self.config.temperature,
-            max_tokens=self.config.max_tokens,
+        return situation_prompt
+
+    def _cached_orders(self, embedding: list[float]) -> Optional[Orders]:
+        """Return orders from the semantic cache on a hit, else None."""
+        cached_text = self.orders_cache.lookup(embedding)
+        if cached_text is None:
+            return None
+        return self._replay_orders(cached_text)
+
+    def _replay_orders(self, cached_text: str) -> Orders:
+        """Record a cached response as this turn's answer and convert to Orders."""
+        self.cache_hit = True
+        self.conversation_history.append({
+            "role": "assistant",
+            "content": cached_text
+        })
+        return self._to_orders(MilitaryOrders.model_validate_json(cached_text))
+
+    def _route_model(self, game_state: dict) -> str:
+        """Pick the model for this turn from the complexity of the situation.
+
+        Complexity is the number of known enemies plus the absolute VP swing
+        plus the number of lost, new or changed friendly units since last briefing.
+        """
+        config = self.config
+        diff = self._last_diff
+        if config.fast_model is None or diff is None or self.turn_count in PIVOTAL_TURNS:
+            return config.model
+        complexity = (
+            len(game_state.get('known_enemies', []))
+            + sum(abs(delta) for delta in diff['vp_delta'].values())
+            + len(diff['lost_units'])
+            + len(diff['new_units'])
+            + len(diff['strength_changes'])
         )
+        return config.fast_model if complexity < config.fast_model_threshold else config.model
+
+    def _request_orders(self, model: str) -> str:
+        """Run the orders completion for the current history and return its text."""
+        # Call the model with structured output
+        response = self.client.chat.completions.create(**self._completion_request(model=model))
+
+        if self.config.stream:
+            # Receive tokens while the model is still decoding
+            chunks = [chunk.choices[0].delta.content or "" for chunk in response if chunk.choices]
+            return "".join(chunks)
+        return response.choices[0].message.content
+
+    async def _arequest_orders(self, model: str) -> str:
+        """Async variant of _request_orders."""
+        response = await self.async_client.chat.completions.create(**self._completion_request(model=model))
+
+        if self.config.stream:
+            chunks = [chunk.choices[0].delta.content or "" async for chunk in response if chunk.choices]
+            return "".join(chunks)
+        return response.choices[0].message.content
+
+    def _completion_request(self, messages: Optional[list[dict]] = None, model: Optional[str] = None) -> dict:
+        """Build chat completion arguments for the current history (or given messages)."""
+        if messages is None:
+            # System prompt first, then history in append order (cacheable prefix)
+            messages = [{"role": "system", "content": self.system_prompt}]
+            if self.config.send_history:
+                messages.extend(self.conversation_history)
+            else:
+                messages.append(self.conversation_history[-1])  # current briefing only
+
+        config = self.config
+        return {
+            "model": model or config.model,
+            "messages": messages,
+            "response_format": self.response_format,
+            "temperature": config.temperature,
+            "max_tokens": config.max_tokens,
+            "stream": config.stream,
+        }
 
-        # Parse response
-        response_text = response.choices[0].message.content
-        orders_dict = json.loads(response_text)
+    def _finish_turn(
+        self,
+        response_text: str,
+        embedding: Optional[list[float]] = None,
+        key: Optional[str] = None,
+    ) -> Orders:
+        """Parse the model response, record it, and convert to Orders."""
+        # Decode and validate in one pass
+        parsed = MilitaryOrders.model_validate_json(response_text)
 
         # Add assistant response to history
         self.conversation_history.append({
@@ -208,131 +608,352 @@ class StrategicAgent(ABC):
             "content": response_text
         })
 
+        if embedding is not None:
+            self.orders_cache.add(embedding, response_text)
+        if key is not None:
+            self.response_cache.put(key, response_text)
+
         # Convert to Orders object
-        return self._dict_to_orders(orders_dict)
+        return self._to_orders(parsed)
+
+    def _history_overflow(self, pending: int = 0) -> int:
+        """Number of leading history messages to fold into a summary (0 if none).
+
+        Compaction waits until twice history_keep_turns turns are stored and
+        then keeps the last history_keep_turns, so the cached prefix is only
+        rebuilt every history_keep_turns turns rather than every turn.
+        pending counts messages about to be appended (the awaited response).
+        """
+        if not self.config.send_history:
+            return 0  # history is never sent, so there is nothing to shrink
+        keep = 2 * self.config.history_keep_turns
+        size = len(self.conversation_history) + pending
+        if size <= 2 * keep:
+            return 0
+        return size - keep
+
+    def _fold_history(self):
+        """Fold old turns into a summary once the history grows too long.
+
+        Runs after every turn, cache hits included, since those append to the
+        history as well.
+        """
+        overflow = self._history_overflow()
+        if overflow:
+            summary = self.client.chat.completions.create(**self._summary_request(overflow))
+            self._compact_history(overflow, summary.choices[0].message.content)
+
+    async def _afold_history(self):
+        """Async variant of _fold_history."""
+        overflow = self._history_overflow()
+        if overflow:
+            summary = await self.async_client.chat.completions.create(**self._summary_request(overflow))
+            self._compact_history(overflow, summary.choices[0].message.content)
+
+    def _summary_request(self, count: int) -> dict:
+        """Build the cheap-model request that summarizes the oldest messages."""
+        transcript = "\n\n".join(
+            f"[{m['role'].upper()}]\n{m['content']}" for m in self.conversation_history[:count]
+        )
+        return {
+            "model": self.config.summary_model,
+            "messages": [
+                {"role": "system", "content": _SUMMARY_INSTRUCTIONS},
+                {"role": "user", "content": transcript},
+            ],
+            "temperature": 0.0,
+            "max_tokens": 1024,
+        }
+
+    def _compact_history(self, count: int, summary: str):
+        """Replace the oldest messages with a single summary message.
+
+        Besides reset(), this is the only sanctioned rewrite of the history.
+        """
+        self.conversation_history = [
+            {"role": "system", "content": f"PRIOR TURNS SUMMARY:\n{summary}"},
+            *self.conversation_history[count:],
+        ]
 
     def _build_situation_prompt(self, game_state: dict, previous_reports: list = None) -> str:
         """Build situation briefing prompt for the agent."""
-        prompt = f"""
+        parts = [f"""
 ## SITUATION REPORT - TURN {game_state['turn']}
 Day {game_state['day']}, Time: {game_state['time_of_day'].upper()}
 Weather: {game_state['weather']}
+"""]
+        diff = self._last_diff = self._diff_state(game_state)
+        full_snapshot = (
+            diff is None
+            or not self.config.send_history  # model can't see earlier rosters
+            or (self.turn_count - 1) % FULL_SNAPSHOT_INTERVAL == 0
+            or len(diff['lost_units']) + len(diff['new_units']) + len(diff['strength_changes']) > DELTA_MAX_CHANGES
+        )
 
-### FRIENDLY FORCES (USE EXACT IDs IN ORDERS)
-"""
-        # Categorize units for clearer presentation
-        categories = {
-            'aircraft': [],
-            'missile': [],
-            'air_defense': [],
-            'artillery': [],
-            'helicopter': [],
-            'drone': [],
-            'ground': [],
-            'special_forces': [],
-            'isr': [],
-            'other': []
-        }
-
-        for unit in game_state.get('own_units', []):
-            unit_type = unit.get('type', 'unknown').lower()
-            unit_id = unit.get('id', 'unknown')
-
-            # Categorize by type
-            if any(x in unit_type for x in ['rafale', 'su30', 'mig', 'mirage', 'f16', 'jf17', 'j10', 'jaguar', 'tejas']):
-                categories['aircraft'].append(unit)
-            elif any(x in unit_type for x in ['brahmos', 'nirbhay', 'pralay', 'babur', 'raad', 'shaheen', 'ghaznavi']):
-                categories['missile'].append(unit)
-            elif any(x in unit_type for x in ['s400', 'akash', 'spyder', 'mrsam', 'hq9', 'hq16', 'spada']):
-                categories['air_defense'].append(unit)
-            elif any(x in unit_type for x in ['pinaka', 'smerch', 'm777', 'dhanush', 'k9', 'a100']):
-                categories['artillery'].append(unit)
-            elif any(x in unit_type for x in ['apache', 'lch', 'rudra', 'chinook', 'cobra', 't129', 'z10', 'mi17']):
-                categories['helicopter'].append(unit)
-            elif any(x in unit_type for x in ['heron', 'harop', 'mq9', 'wing_loong', 'burraq', 'shahpar']):
-                categories['drone'].append(unit)
-            elif any(x in unit_type for x in ['corps', 'division', 'brigade', 'infantry', 'armor', 'mech', 'mountain']):
-                categories['ground'].append(unit)
-            elif any(x in unit_type for x in ['para_sf', 'marcos', 'garud', 'ssg', 'zarrar']):
-                categories['special_forces'].append(unit)
-            elif any(x in unit_type for x in ['awacs', 'phalcon', 'netra', 'erieye']):
-                categories['isr'].append(unit)
-            else:
-                categories['other'].append(unit)
-
-        # Print each category with exact IDs
-        for cat_name, units in categories.items():
-            if units:
-                prompt += f"\n**{cat_name.upper()}** ({len(units)} units):\n"
-                for u in units:
-                    prompt += f"  - ID: `{u['id']}` | Type: {u.get('type', 'N/A')} | Strength: {u.get('strength', 'N/A')} | Status: {u.get('status', 'ready')}\n"
+        if full_snapshot:
+            parts.append("\n### FRIENDLY FORCES (USE EXACT IDs IN ORDERS)\n")
+            self._build_orbat_snapshot(game_state, parts)
+        else:
+            parts.append("\n### FRIENDLY FORCES - CHANGES SINCE LAST TURN (USE EXACT IDs IN ORDERS)\n")
+            parts.append("Units not listed are unchanged from the last full roster.\n")
+            if diff['lost_units']:
+                parts.append(f"**Lost** ({len(diff['lost_units'])}):\n")
+                parts.extend(
+                    f"  - ID: `{u['id']}` | Type: {u.get('type', 'N/A')}\n"
+                    for u in diff['lost_units']
+                )
+            if diff['new_units']:
+                parts.append(f"**New** ({len(diff['new_units'])}):\n")
+                parts.extend(map(_format_unit_line, diff['new_units']))
+            if diff['strength_changes']:
+                parts.append(f"**Changed** ({len(diff['strength_changes'])}):\n")
+                parts.extend(
+                    f"  - ID: `{u['id']}` | Type: {u.get('type', 'N/A')} | Strength: {before.get('strength', 'N/A')} -> {u.get('strength', 'N/A')} | Status: {u.get('status', 'ready')}\n"
+                    for u, before in diff['strength_changes']
+                )
+            if not diff['lost_units'] and not diff['new_units'] and not diff['strength_changes']:
+                parts.append("No changes.\n")
 
         # Enemy intelligence
-        prompt += "\n### ENEMY FORCES (INTELLIGENCE)\n"
+        parts.append("\n### ENEMY FORCES (INTELLIGENCE)\n")
 
         known = game_state.get('known_enemies', [])
         if known:
-            prompt += f"**Confirmed contacts**: {len(known)}\n"
-            for enemy in known[:10]:
-                prompt += f"  - {enemy.get('type', 'Unknown')}: location {enemy.get('location')}, est. strength {enemy.get('estimated_strength', 'unknown')}\n"
+            parts.append(f"**Confirmed contacts**: {len(known)}\n")
+            if diff is not None:
+                parts.append(f"New since last turn: {len(diff['new_contacts'])}\n")
+            parts.extend(
+                f"  - {enemy.get('type', 'Unknown')}: location {enemy.get('location')}, est. strength {enemy.get('estimated_strength', 'unknown')}\n"
+                for enemy in known[:10]
+            )
         else:
-            prompt += "No confirmed enemy contacts.\n"
+            parts.append("No confirmed enemy contacts.\n")
 
         suspected = game_state.get('suspected_enemies', [])
         if suspected:
-            prompt += f"\n**Suspected contacts**: {len(suspected)}\n"
+            parts.append(f"\n**Suspected contacts**: {len(suspected)}\n")
 
         # Supply status
         supply = game_state.get('supply_status', {})
-        prompt += f"\n### LOGISTICS\n"
-        prompt += f"Units undersupplied: {supply.get('units_undersupplied', 0)}\n"
-        prompt += f"Effective supply capacity: {supply.get('effective_capacity', 'N/A')}\n"
+        parts.append(
+            "\n### LOGISTICS\n"
+            f"Units undersupplied: {supply.get('units_undersupplied', 0)}\n"
+            f"Effective supply capacity: {supply.get('effective_capacity', 'N/A')}\n"
+        )
 
         # VP status
         vp = game_state.get('vp', {})
-        prompt += f"\n### VICTORY POINTS\n"
-        prompt += f"India: {vp.get('india', 0)} | Pakistan: {vp.get('pakistan', 0)}\n"
+        parts.append(
+            "\n### VICTORY POINTS\n"
+            f"India: {vp.get('india', 0)} | Pakistan: {vp.get('pakistan', 0)}\n"
+        )
+        if diff is not None:
+            parts.append(f"Change since last turn: India {diff['vp_delta']['india']:+d} | Pakistan {diff['vp_delta']['pakistan']:+d}\n")
 
         # Previous turn results
         if previous_reports:
-            prompt += "\n### PREVIOUS TURN RESULTS\n"
-            for report in previous_reports[-5:]:  # Last 5 reports
-                prompt += f"- {report.get('phase', 'unknown')}: {report.get('result', 'unknown')}\n"
+            parts.append("\n### PREVIOUS TURN RESULTS\n")
+            parts.extend(
+                f"- {report.get('phase', 'unknown')}: {report.get('result', 'unknown')}\n"
+                for report in previous_reports[-5:]  # Last 5 reports
+            )
+
+        parts.append(_ORDERS_REQUIRED)
 
-        prompt += "\n### ORDERS REQUIRED\n"
-        prompt += "Issue orders for all domains: missiles, EW, air, drones, artillery, helicopters, ground, special forces.\n"
-        prompt += "Consider: current objectives, enemy disposition, weather, supply status.\n"
-        prompt += "IMPORTANT: For missile strikes, fire 2-4 missiles per salvo against high-value targets (airbases, C2, SAM sites) to ensure kill probability. Single-missile strikes often miss.\n"
+        return "".join(parts)
 
-        return prompt
+    def _build_orbat_snapshot(self, game_state: dict, parts: list[str]):
+        """Append the full friendly order of battle, grouped by category, to parts."""
+        # Categorize units for clearer presentation
+        units = game_state.get('own_units', [])
+        # One column of unit types, categorized once per distinct type
+        unit_categories = map(_categorize_unit_type, [u.get('type', 'unknown') for u in units])
+        categories = {cat: [] for cat in UNIT_CATEGORIES}
+        for unit, category in zip(units, unit_categories):
+            categories[category].append(unit)
+
+        # Print each category with exact IDs
+        for cat_name, units in categories.items():
+            if units:
+                parts.append(f"\n**{cat_name.upper()}** ({len(units)} units):\n")
+                parts.extend(map(_format_unit_line, units))
+
+    def _diff_state(self, game_state: dict) -> Optional[dict]:
+        """Diff against the previously briefed game state (None on the first turn)."""
+        prev = self._prev_state
+        self._prev_state = game_state
+        if prev is None:
+            return None
+
+        prev_units = {u.get('id'): u for u in prev.get('own_units', [])}
+        # (strength, status) per unit ID, read once per unit and compared as tuples
+        prev_fields = {uid: (u.get('strength'), u.get('status')) for uid, u in prev_units.items()}
+        current_ids = set()
+        new_units = []
+        strength_changes = []
+        for u in game_state.get('own_units', []):
+            uid = u.get('id')
+            current_ids.add(uid)
+            before = prev_fields.get(uid)
+            if before is None:
+                new_units.append(u)
+            elif before != (u.get('strength'), u.get('status')):
+                strength_changes.append((u, prev_units[uid]))
+
+        prev_known = {e.get('id') for e in prev.get('known_enemies', [])}
+        prev_vp = prev.get('vp', {})
+        vp = game_state.get('vp', {})
 
-    def _dict_to_orders(self, orders_dict: dict) -> Orders:
-        """Convert dictionary response to Orders object."""
+        return {
+            'lost_units': [u for uid, u in prev_units.items() if uid not in current_ids],
+            'new_units': new_units,
+            'strength_changes': strength_changes,
+            'new_contacts': [e for e in game_state.get('known_enemies', []) if e.get('id') not in prev_known],
+            'vp_delta': {
+                'india': vp.get('india', 0) - prev_vp.get('india', 0),
+                'pakistan': vp.get('pakistan', 0) - prev_vp.get('pakistan', 0),
+            },
+        }
+
+    def _to_orders(self, parsed: MilitaryOrders) -> Orders:
+        """Convert a validated response to an Orders object."""
+        # Keep reasoning from the parse we already did; get_reasoning reads it
+        self._last_reasoning = parsed.reasoning
         return Orders(
             faction=self.faction,
             turn=self.turn_count,
-            missile_strikes=orders_dict.get('missile_strikes', []),
-            ew_missions=orders_dict.get('ew_missions', []),
-            air_missions=orders_dict.get('air_missions', []),
-            drone_missions=orders_dict.get('drone_missions', []),
-            artillery_missions=orders_dict.get('artillery_missions', []),
-            helicopter_missions=orders_dict.get('helicopter_missions', []),
-            ground_orders=orders_dict.get('ground_orders', []),
-            sf_missions=orders_dict.get('sf_missions', []),
+            **parsed.model_dump(exclude={'reasoning'}),
         )
 
     def get_reasoning(self) -> Optional[str]:
         """Get the last reasoning from the agent."""
-        if self.conversation_history:
-            last = self.conversation_history[-1]
-            if last['role'] == 'assistant':
-                try:
-                    return json.loads(last['content']).get('reasoning')
-                except:
-                    return None
-        return None
+        return self._last_reasoning
 
     def reset(self):
         """Reset agent state for a new game."""
         self.conversation_history = []
         self.turn_count = 0
+        self._prev_state = None
+        self._last_reasoning = None
+        self._last_diff = None
+        self.cache_hit = False
+
+
+def _run_batch(requests: list[tuple[str, dict]], poll_interval: float = 30.0) -> dict[str, str]:
+    """Run (custom_id, body) chat completions as one Batch API request.
+
+    Blocks until the batch finishes; returns response text by custom_id.
+    """
+    client = get_client()
+    lines = [
+        json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body,
+        })
+        for custom_id, body in requests
+    ]
+
+    batch_file = client.files.create(
+        file=("orders_batch.jsonl", "\n".join(lines).encode()),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Orders batch {batch.id} ended with status {batch.status}")
+
+    responses = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        response = result.get("response") or {}
+        if result.get("error") or response.get("status_code") != 200:
+            raise RuntimeError(f"Orders batch request {result['custom_id']} failed: {result.get('error')}")
+        responses[result["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+    return responses
+
+
+def batch_generate_orders(
+    jobs: list[tuple[StrategicAgent, dict, Optional[list]]],
+    poll_interval: float = 30.0,
+) -> list[Orders]:
+    """Generate orders for (agent, game_state, previous_reports) jobs in one Batch API request.
+
+    Jobs may mix agents, e.g. both factions of several concurrent games. See
+    StrategicAgent.generate_orders_batch; returns orders in job order.
+    """
+    responses = _run_batch(
+        [
+            (f"{agent.faction}-{i}", agent._batch_body(game_state, previous_reports))
+            for i, (agent, game_state, previous_reports) in enumerate(jobs)
+        ],
+        poll_interval,
+    )
+
+    orders = []
+    for i, (agent, game_state, _) in enumerate(jobs):
+        parsed = MilitaryOrders.model_validate_json(responses[f"{agent.faction}-{i}"])
+        orders.append(Orders(
+            faction=agent.faction,
+            turn=game_state['turn'] + 1,  # the turn these orders are for, as in a live turn
+            **parsed.model_dump(exclude={'reasoning'}),
+        ))
+    return orders
+
+
+def batch_play_turn(
+    jobs: list[tuple[StrategicAgent, dict, Optional[list]]],
+    poll_interval: float = 30.0,
+) -> list[Orders]:
+    """Play one live turn for each (agent, game_state, previous_reports) job via one Batch API request.
+
+    Unlike batch_generate_orders, each agent advances exactly as in
+    generate_orders: the briefing and reply join its history, its reasoning
+    and cache status are set, and old turns are folded into a summary. The
+    response cache is consulted first; the semantic cache is not, as it
+    needs a live embedding call per job. Each agent may appear at most once.
+    Returns orders in job order.
+    """
+    orders: list[Optional[Orders]] = [None] * len(jobs)
+    requests = []
+    pending = []  # (job index, agent, model, response cache key)
+    for i, (agent, game_state, previous_reports) in enumerate(jobs):
+        agent._begin_turn(game_state, previous_reports)
+
+        key = None
+        if agent.response_cache is not None:
+            key = agent.response_cache.key(agent.system_prompt, game_state, previous_reports)
+            cached_text = agent.response_cache.get(key)
+            if cached_text is not None:
+                orders[i] = agent._replay_orders(cached_text)
+                continue
+
+        model = agent._route_model(game_state)
+        body = agent._completion_request(model=model)
+        del body["stream"]
+        requests.append((f"{agent.faction}-{i}", body))
+        pending.append((i, agent, model, key))
+
+    responses = _run_batch(requests, poll_interval) if requests else {}
+    for i, agent, model, key in pending:
+        try:
+            orders[i] = agent._finish_turn(responses[f"{agent.faction}-{i}"], key=key)
+        except ValidationError:
+            if model == agent.config.model:
+                raise
+            # The fast model produced invalid orders; retry once live with the full one
+            orders[i] = agent._finish_turn(agent._request_orders(agent.config.model), key=key)
+
+    for agent, _, _ in jobs:
+        agent._fold_history()
+    return orders
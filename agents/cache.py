@@ -0,0 +1,162 @@
+"""
+Response caches for strategic agents.
+
+Situation briefings are often near-identical turn to turn (same units, same
+weather, small VP delta). Orders for a briefing whose embedding is close
+enough to a previous one are reused instead of running a full completion.
+Identical queries (same doctrine, game state and reports) are served from an
+exact-match cache that persists across runs.
+"""
+
+import hashlib
+import json
+import math
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:  # optional: only speeds up response cache keys
+    orjson = None
+
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+RESPONSE_CACHE_DIR = Path("~/.wargame/cache")
+
+
+def _canonical_json(obj) -> bytes:
+    """Serialize with sorted keys so equal states hash equally."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, sort_keys=True, default=str).encode()
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    """L2-normalize a vector so a dot product equals cosine similarity."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        return list(vector)
+    return [x / norm for x in vector]
+
+
+class SemanticOrdersCache:
+    """Nearest-neighbour cache of orders keyed by situation prompt embedding.
+
+    A game produces a few dozen entries at most, so a flat inner-product scan
+    over normalized vectors is exact and cheap; no ANN index is needed.
+    """
+
+    def __init__(self, threshold: float = 0.92, path: Optional[Path | str] = None):
+        self.threshold = threshold
+        self.path = Path(path) if path else None
+        self.embeddings: list[list[float]] = []
+        self.responses: list[str] = []
+
+        if self.path and self.path.exists():
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def embed(self, client, text: str) -> list[float]:
+        """Embed a situation prompt with the small embedding model."""
+        response = client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+        return _normalize(response.data[0].embedding)
+
+    async def aembed(self, client, text: str) -> list[float]:
+        """Embed a situation prompt using an async OpenAI client."""
+        response = await client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+        return _normalize(response.data[0].embedding)
+
+    def lookup(self, embedding: list[float], threshold: Optional[float] = None) -> Optional[str]:
+        """Return the cached response text of the closest entry above threshold."""
+        if threshold is None:
+            threshold = self.threshold
+
+        best_score = threshold
+        best_response = None
+        for cached, response_text in zip(self.embeddings, self.responses):
+            score = sum(a * b for a, b in zip(embedding, cached))
+            if score >= best_score:
+                best_score = score
+                best_response = response_text
+        return best_response
+
+    def add(self, embedding: list[float], response_text: str):
+        """Store a response under its situation embedding."""
+        self.embeddings.append(embedding)
+        self.responses.append(response_text)
+        if self.path:
+            self.save()
+
+    def save(self):
+        """Persist the cache to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump({"embeddings": self.embeddings, "responses": self.responses}, f)
+
+    def load(self):
+        """Load a previously persisted cache."""
+        with open(self.path) as f:
+            data = json.load(f)
+        self.embeddings = data.get("embeddings", [])
+        self.responses = data.get("responses", [])
+
+    def clear(self):
+        """Drop all cached entries."""
+        self.embeddings = []
+        self.responses = []
+
+
+class ResponseCache:
+    """Exact-match cache of orders responses keyed by a hash of the query.
+
+    Recently used entries are kept in memory; every entry is also written to
+    disk as <hash>.json so re-runs of a scenario skip the LLM entirely.
+    """
+
+    def __init__(self, path: Optional[Path | str] = None, maxsize: int = 256):
+        self.path = Path(path or RESPONSE_CACHE_DIR).expanduser()
+        self.maxsize = maxsize
+        self.entries: OrderedDict[str, str] = OrderedDict()
+
+    @staticmethod
+    def key(system_prompt: str, game_state: dict, previous_reports: Optional[list] = None) -> str:
+        """Hash the doctrine, game state and previous reports of a query."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(system_prompt.encode())
+        digest.update(_canonical_json(game_state))
+        digest.update(_canonical_json(previous_reports or []))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response text for a key, or None on a miss."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        entry_path = self.path / f"{key}.json"
+        if not entry_path.exists():
+            return None
+        with open(entry_path) as f:
+            response_text = json.load(f)["response"]
+        self._remember(key, response_text)
+        return response_text
+
+    def put(self, key: str, response_text: str):
+        """Store a response in memory and on disk."""
+        self._remember(key, response_text)
+        self.path.mkdir(parents=True, exist_ok=True)
+        with open(self.path / f"{key}.json", "w") as f:
+            json.dump({"response": response_text}, f)
+
+    def _remember(self, key: str, response_text: str):
+        self.entries[key] = response_text
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """Drop in-memory entries (persisted entries are kept)."""
+        self.entries.clear()
@@ -0,0 +1,61 @@
+"""
+Shared OpenAI clients for all strategic agents.
+
+One client per process means India, Pakistan and the semantic cache reuse a
+single HTTP connection pool, so TLS handshakes and TCP slow-start are paid
+once per game instead of once per agent.
+"""
+
+from typing import Optional
+
+import httpx
+from openai import OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient
+
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:  # optional: lets concurrent agent requests share one connection
+    _HTTP2 = False
+
+
+# httpx drops idle connections after 5s by default, shorter than combat
+# resolution and logging between turns; keep them open across turns so each
+# turn's requests reuse the warm TLS connections of the previous one.
+KEEPALIVE_EXPIRY = 120.0
+_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=KEEPALIVE_EXPIRY)
+
+_client: Optional[OpenAI] = None
+_async_client: Optional[AsyncOpenAI] = None
+
+
+def get_client() -> OpenAI:
+    """Get the process-wide sync OpenAI client (uses OPENAI_API_KEY env var)."""
+    global _client
+    if _client is None:
+        _client = OpenAI(max_retries=2, http_client=DefaultHttpxClient(limits=_LIMITS))
+    return _client
+
+
+def get_async_client() -> AsyncOpenAI:
+    """Get the process-wide async OpenAI client.
+
+    Its connection pool is bound to the event loop that first uses it, so
+    drive all async agent calls from a single event loop and close it with
+    aclose_async_client() before that loop ends. Uses HTTP/2 when h2 is
+    installed.
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncOpenAI(
+            max_retries=2,
+            http_client=DefaultAsyncHttpxClient(limits=_LIMITS, http2=_HTTP2),
+        )
+    return _async_client
+
+
+async def aclose_async_client():
+    """Close the shared async client; the next get_async_client() opens a new one."""
+    global _async_client
+    if _async_client is not None:
+        client, _async_client = _async_client, None
+        await client.close()
@@ -5,19 +5,7 @@ India strategic agent - implements Indian military doctrine.
 from .base import StrategicAgent, AgentConfig
 
 
-class IndiaAgent(StrategicAgent):
-    """
-    Strategic agent representing Indian military command.
-
-    Doctrine: Proactive Strategy (Cold Start) — readiness-based warfare.
-    Objectives: Non-contact opening, air dominance, multiple IBG shallow thrusts
-    (50-80km) on Shakargarh/Sialkot/Rajasthan axes. Seize territory as bargaining
-    chip. Stay below nuclear threshold. Achieve objectives within 48 hours.
-    """
-
-    @property
-    def system_prompt(self) -> str:
-        return """You are the strategic commander of Indian Armed Forces in a conventional conflict with Pakistan.
+_INDIA_SYSTEM_PROMPT = """You are the strategic commander of Indian Armed Forces in a conventional conflict with Pakistan.
 
 ## YOUR ROLE
 You are the Combined Forces Commander making strategic and operational decisions. You receive intelligence and situation reports, and issue orders across all domains: missiles, electronic warfare, air, drones, artillery, helicopters, ground forces, and special forces.
@@ -117,6 +105,19 @@ Provide orders in the specified JSON format. Include reasoning for your strategi
 
 Speed. Violence of action. Multiple axes. Stay below nuclear threshold. Achieve objectives before the world intervenes."""
 
+
+class IndiaAgent(StrategicAgent):
+    """
+    Strategic agent representing Indian military command.
+
+    Doctrine: Proactive Strategy (Cold Start) — readiness-based warfare.
+    Objectives: Non-contact opening, air dominance, multiple IBG shallow thrusts
+    (50-80km) on Shakargarh/Sialkot/Rajasthan axes. Seize territory as bargaining
+    chip. Stay below nuclear threshold. Achieve objectives within 48 hours.
+    """
+
+    system_prompt = _INDIA_SYSTEM_PROMPT
+
     @classmethod
     def create_default(cls) -> "IndiaAgent":
         """Create agent with default configuration."""
@@ -126,13 +127,13 @@ Speed. Violence of action. Multiple axes. Stay below nuclear threshold. Achieve
             risk_tolerance=0.7,
             air_priority="non_contact_opening_then_superiority",
             ground_priority="shallow_thrust_multiple_axes",
-            constraints=[
+            constraints=(
                 "stay_below_nuclear_threshold",
                 "shallow_thrusts_50_80km_only",
                 "minimize_civilian_casualties",
                 "avoid_pak_nuclear_sites",
                 "no_major_cities_lahore_karachi",
                 "achieve_objectives_within_48hrs"
-            ]
+            )
         )
         return cls(config)
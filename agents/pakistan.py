@@ -5,17 +5,7 @@ Pakistan strategic agent - implements Pakistani military doctrine.
 from .base import StrategicAgent, AgentConfig
 
 
-class PakistanAgent(StrategicAgent):
-    """
-    Strategic agent representing Pakistani military command.
-
-    Doctrine: Defensive attrition, preserve forces for counterattack.
-    Objectives: Blunt Indian offensive, hold Lahore, inflict maximum casualties.
-    """
-
-    @property
-    def system_prompt(self) -> str:
-        return """You are the strategic commander of Pakistan Armed Forces in a conventional conflict with India.
+_PAKISTAN_SYSTEM_PROMPT = """You are the strategic commander of Pakistan Armed Forces in a conventional conflict with India.
 
 ## YOUR ROLE
 You are the Joint Chiefs Chairman making strategic and operational decisions. You receive intelligence and situation reports, and issue orders across all domains: missiles, electronic warfare, air, drones, artillery, helicopters, ground forces, and special forces.
@@ -100,6 +90,17 @@ Provide orders in the specified JSON format. Include reasoning for your strategi
 
 Be patient and disciplined. Do not waste forces in hopeless counterattacks. Make India pay for every kilometer."""
 
+
+class PakistanAgent(StrategicAgent):
+    """
+    Strategic agent representing Pakistani military command.
+
+    Doctrine: Defensive attrition, preserve forces for counterattack.
+    Objectives: Blunt Indian offensive, hold Lahore, inflict maximum casualties.
+    """
+
+    system_prompt = _PAKISTAN_SYSTEM_PROMPT
+
     @classmethod
     def create_default(cls) -> "PakistanAgent":
         """Create agent with default configuration."""
@@ -109,10 +110,10 @@ Be patient and disciplined. Do not waste forces in hopeless counterattacks. Make
             risk_tolerance=0.5,
             air_priority="deny_superiority",
             ground_priority="defense_in_depth",
-            constraints=[
+            constraints=(
                 "defend_lahore_at_all_costs",
                 "preserve_strike_corps_for_counter",
                 "signal_nuclear_if_lahore_threatened"
-            ]
+            )
         )
         return cls(config)
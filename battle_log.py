@@ -4,8 +4,12 @@ Live battle log - streams events as they happen.
 """
 
 import os
-import time
+import atexit
+import asyncio
+import logging
 import sys
+from logging.handlers import MemoryHandler
+from functools import lru_cache
 from pathlib import Path
 
 # Load .env from project root (same as game.py)
@@ -14,12 +18,55 @@ load_dotenv(Path(__file__).parent / ".env")
 from engine import HexMap, UnitManager, LogisticsSystem, FogOfWar, TurnManager, Faction
 from engine.turn import Orders, Phase
 from agents import IndiaAgent, PakistanAgent
-from agents.base import AgentConfig
+from agents.base import AgentConfig, batch_play_turn
+from agents.client import aclose_async_client
 
 # Configuration
 MAX_TURNS = 2  # Change this to run more turns
+# Cosmetic pauses between log lines; off unless WARGAME_DRAMATIC=1
+DRAMATIC_PAUSES = os.getenv("WARGAME_DRAMATIC", "0") == "1"
+LINE_PAUSE = 0.05
+
+# Optional copy of the log in a file, written in large blocks at turn boundaries
+LOG_FILE = os.getenv("WARGAME_LOG")
+_file_log = logging.getLogger("battle_log")
+_file_log.propagate = False
+if LOG_FILE:
+    _log_stream = open(LOG_FILE, "w", buffering=1 << 20, encoding="utf-8")
+    _file_log.setLevel(logging.INFO)
+    _file_log.addHandler(MemoryHandler(
+        capacity=1000,
+        flushLevel=logging.ERROR,
+        target=logging.StreamHandler(_log_stream),
+    ))
+
+# Log line prefix per source; anything unlisted is Pakistan
+_PREFIX = {
+    "india": "🇮🇳 INDIA",
+    "system": "⚡ SYSTEM",
+    "combat": "💥 COMBAT",
+    "intel": "📡 INTEL",
+}
+
+# (Orders attribute, formatter) per order type, one log line per order
+_ORDER_RENDERERS = (
+    ("missile_strikes", lambda s: f"🚀 MISSILE: {s.get('missiles', 1)}x → {s.get('target_id')} ({s.get('target_type')})"),
+    ("air_missions", lambda m: (f"✈️  AIR {m.get('mission_type', m.get('type', '?')).upper()}: "
+                                f"{m.get('aircraft', '?')} aircraft → {m.get('target_id', 'patrol')}")),
+    ("artillery_missions", lambda m: f"💣 ARTY: {m.get('rounds', '?')} rounds → {m.get('target_id')}"),
+    ("ground_orders", lambda o: f"🪖 GROUND: {o.get('unit_id')} → {o.get('action', '?').upper()}"),
+    ("sf_missions", lambda m: f"🎯 SF: {m.get('mission_type', '?').upper()} mission"),
+)
+
+# (Orders attribute, template) per order type summarized as a single count line
+_ORDER_COUNTS = (
+    ("ew_missions", "📶 EW: {} {}"),
+    ("drone_missions", "🛸 DRONE: {} ISR missions"),
+)
+_EW_LABEL = {"india": "jamming operations", "pakistan": "operations"}
 
 # Time mapping for turns
+@lru_cache(maxsize=256)
 def get_time_str(turn, phase_idx=0):
     """Get realistic time string for turn/phase."""
     day = ((turn - 1) // 4) + 1
@@ -31,182 +78,349 @@ def get_time_str(turn, phase_idx=0):
         day += 1
     return f"Day {day}, {hour:02d}:{(phase_idx * 7) % 60:02d}"
 
+@lru_cache(maxsize=256)
 def get_time_period(turn):
     """Get time period name."""
     turn_in_day = (turn - 1) % 4
     return ["DAWN", "MIDDAY", "DUSK", "NIGHT"][turn_in_day]
 
-def log(faction, message, time_str=None):
-    """Print a battle log entry."""
-    prefix = "🇮🇳 INDIA" if faction == "india" else "🇵🇰 PAKISTAN"
-    if faction == "system":
-        prefix = "⚡ SYSTEM"
-    elif faction == "combat":
-        prefix = "💥 COMBAT"
-    elif faction == "intel":
-        prefix = "📡 INTEL"
-
-    time_prefix = f"[{time_str}] " if time_str else ""
-    print(f"{time_prefix}{prefix}: {message}")
-    sys.stdout.flush()
-    time.sleep(0.05)
-
-def log_header(text):
-    """Print a header."""
-    print(f"\n{'='*70}")
-    print(f"  {text}")
-    print(f"{'='*70}\n")
-    sys.stdout.flush()
-
-def run_turn(turn_mgr, india_agent, pak_agent, units, turn_num):
-    """Run a single turn with live logging."""
+def emit(text=""):
+    """Write a line to stdout and, if WARGAME_LOG is set, to the log file."""
+    print(text)
+    _file_log.info(text)
+
+def flush_log_file():
+    """Push buffered log file records to disk."""
+    for handler in _file_log.handlers:
+        handler.flush()
+        handler.target.flush()
+
+atexit.register(flush_log_file)
+
+class GameLog:
+    """One game's log.
+
+    With a tag (e.g. "GAME 2") every line is prefixed "[GAME 2] ", on stdout
+    and in the log file, so concurrent games' interleaved lines can be told
+    apart. The count of lines logged since the last pause is also kept per
+    game, so a game's pauses only wait for its own lines.
+    """
+
+    def __init__(self, tag=""):
+        self.prefix = f"[{tag}] " if tag else ""
+        self.pending_lines = 0
+
+    def emit(self, text=""):
+        """Write this game's text, each line tagged with the game."""
+        if self.prefix:
+            text = "\n".join(self.prefix + line for line in text.split("\n"))
+        emit(text)
+
+    def log(self, faction, message, time_str=None):
+        """Print a battle log entry."""
+        prefix = _PREFIX.get(faction, "🇵🇰 PAKISTAN")
+        time_prefix = f"[{time_str}] " if time_str else ""
+        self.emit(f"{time_prefix}{prefix}: {message}")
+        self.pending_lines += 1
+
+    def header(self, text):
+        """Print a header."""
+        self.emit(f"\n{'='*70}")
+        self.emit(f"  {text}")
+        self.emit(f"{'='*70}\n")
+
+    async def pause(self, seconds=0.0):
+        """Flush the log at a phase boundary, then take any dramatic pause.
+
+        The pause is the given seconds plus LINE_PAUSE per line logged since the last one.
+        """
+        sys.stdout.flush()
+        total = seconds + LINE_PAUSE * self.pending_lines
+        self.pending_lines = 0
+        if DRAMATIC_PAUSES and total > 0:
+            await asyncio.sleep(total)
+
+def log_orders(game_log, faction, orders, time_str):
+    """Log one faction's orders, one line per order plus count summaries."""
+    game_log.emit()
+    for attr, render in _ORDER_RENDERERS:
+        for item in getattr(orders, attr):
+            game_log.log(faction, render(item), time_str)
+    for attr, template in _ORDER_COUNTS:
+        items = getattr(orders, attr)
+        if items:
+            game_log.log(faction, template.format(len(items), _EW_LABEL[faction]), time_str)
+
+# (faction, engine faction, command banner, war room) per side, in reporting order
+_COMMANDS = (
+    ("india", Faction.INDIA, "🇮🇳 INDIA COMMAND", "New Delhi war room"),
+    ("pakistan", Faction.PAKISTAN, "🇵🇰 PAKISTAN COMMAND", "Rawalpindi GHQ"),
+)
+
+def idle_reason(faction, agent, state, units):
+    """Why a faction skips planning this turn, or None if it plans."""
+    if units.count_effective(faction) == 0:
+        return "No effective forces — no orders issued"
+    # A command configured to hold with nothing to shoot at sits the turn out
+    if state["turn"] > 0 and not state.get("known_enemies") and agent.config.hold_when_blind:
+        return "No enemy contacts — holding positions"
+    return None
+
+def hold_orders(faction, state):
+    """Empty orders for a faction that skips planning: every unit keeps its posture."""
+    return Orders(faction=faction, turn=state["turn"] + 1)
+
+def cache_status(agent, idle):
+    """Cache outcome of a faction's planning this turn, for the log."""
+    if idle:
+        return "SKIPPED"
+    return "HIT" if agent.cache_hit else "MISS"
+
+async def plan_live(commands, previous_reports):
+    """All commands plan concurrently with live completions.
+
+    commands is a sequence of (faction, agent, state); a None agent holds.
+    """
+    async def plan_one(faction, agent, state):
+        if agent is None:
+            return hold_orders(faction, state)
+        return await agent.agenerate_orders(state, previous_reports)
+
+    return await asyncio.gather(*(plan_one(*command) for command in commands))
+
+class BatchPlanner:
+    """Plans a turn for every game at once with a single Batch API request.
+
+    Each game's plan() call waits until all games have submitted their turn,
+    so the games must run concurrently and in lockstep. Agents advance as in
+    a live turn, so reasoning and cache status are logged the same way.
+    """
+
+    def __init__(self, games):
+        self.games = games
+        self.pending = []
+
+    async def plan(self, commands, previous_reports):
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((commands, previous_reports, future))
+        if len(self.pending) == self.games:
+            pending, self.pending = self.pending, []
+            # Agents that hold (None) get empty orders and no batch request
+            jobs = [
+                (agent, state, reports)
+                for commands, reports, _ in pending
+                for _, agent, state in commands
+                if agent is not None
+            ]
+            try:
+                batched = iter(await asyncio.to_thread(batch_play_turn, jobs) if jobs else [])
+            except Exception as e:
+                for _, _, waiter in pending:
+                    waiter.set_exception(e)
+            else:
+                for commands, _, waiter in pending:
+                    waiter.set_result([
+                        next(batched) if agent is not None else hold_orders(faction, state)
+                        for faction, agent, state in commands
+                    ])
+        return await future
+
+async def run_turn(turn_mgr, india_agent, pak_agent, units, turn_num, plan=plan_live, game_log=None):
+    """Run a single turn with live logging.
+
+    game_log carries the game's line tag and pause bookkeeping across turns;
+    an untagged one is used if omitted.
+    """
+    game_log = game_log or GameLog()
     time_str = get_time_str(turn_num)
     time_period = get_time_period(turn_num)
     day = ((turn_num - 1) // 4) + 1
 
-    log_header(f"TURN {turn_num} - {time_str} - {time_period}")
+    game_log.header(f"TURN {turn_num} - {time_str} - {time_period}")
 
     # Get state
-    india_state = turn_mgr.get_game_state_for_agent("india")
-    pak_state = turn_mgr.get_game_state_for_agent("pakistan")
+    agents = {"india": india_agent, "pakistan": pak_agent}
+    states = {name: turn_mgr.get_game_state_for_agent(name) for name, *_ in _COMMANDS}
 
     # Show intel summary
-    india_known = len(india_state.get('known_enemies', []))
-    pak_known = len(pak_state.get('known_enemies', []))
-    log("intel", f"India tracks {india_known} enemy units | Pakistan tracks {pak_known} enemy units", time_str)
+    game_log.log("intel", " | ".join(
+        f"{name.title()} tracks {len(states[name].get('known_enemies', []))} enemy units" for name, *_ in _COMMANDS
+    ), time_str)
 
     # Get previous reports for context
     previous_reports = []
     if turn_mgr.game_state.turn_history:
         previous_reports = turn_mgr.game_state.turn_history[-1].combat_reports
 
-    # India planning
-    print("\n--- 🇮🇳 INDIA COMMAND ---\n")
-    log("system", "New Delhi war room convening...", time_str)
-    time.sleep(0.3)
-
-    india_orders = india_agent.generate_orders(india_state, previous_reports)
-    india_reasoning = india_agent.get_reasoning()
-    log("india", f"{india_reasoning[:250]}..." if india_reasoning else "Orders issued.", time_str)
-
-    # India orders
-    print()
-    for strike in india_orders.missile_strikes:
-        log("india", f"🚀 MISSILE: {strike.get('missiles', 1)}x → {strike.get('target_id')} ({strike.get('target_type')})", time_str)
-    for mission in india_orders.air_missions:
-        mtype = mission.get('mission_type', mission.get('type', '?')).upper()
-        log("india", f"✈️  AIR {mtype}: {mission.get('aircraft', '?')} aircraft → {mission.get('target_id', 'patrol')}", time_str)
-    for mission in india_orders.artillery_missions:
-        log("india", f"💣 ARTY: {mission.get('rounds', '?')} rounds → {mission.get('target_id')}", time_str)
-    for order in india_orders.ground_orders:
-        log("india", f"🪖 GROUND: {order.get('unit_id')} → {order.get('action', '?').upper()}", time_str)
-    for mission in india_orders.sf_missions:
-        log("india", f"🎯 SF: {mission.get('mission_type', '?').upper()} mission", time_str)
-    if india_orders.ew_missions:
-        log("india", f"📶 EW: {len(india_orders.ew_missions)} jamming operations", time_str)
-    if india_orders.drone_missions:
-        log("india", f"🛸 DRONE: {len(india_orders.drone_missions)} ISR missions", time_str)
-
-    # Pakistan response
-    print("\n--- 🇵🇰 PAKISTAN COMMAND ---\n")
-    time.sleep(0.3)
-    log("system", "Rawalpindi GHQ responding...", time_str)
-    time.sleep(0.3)
-
-    pak_orders = pak_agent.generate_orders(pak_state, previous_reports)
-    pak_reasoning = pak_agent.get_reasoning()
-    log("pakistan", f"{pak_reasoning[:250]}..." if pak_reasoning else "Orders issued.", time_str)
-
-    print()
-    for strike in pak_orders.missile_strikes:
-        log("pakistan", f"🚀 MISSILE: {strike.get('missiles', 1)}x → {strike.get('target_id')} ({strike.get('target_type')})", time_str)
-    for mission in pak_orders.air_missions:
-        mtype = mission.get('mission_type', mission.get('type', '?')).upper()
-        log("pakistan", f"✈️  AIR {mtype}: {mission.get('aircraft', '?')} aircraft → {mission.get('target_id', 'patrol')}", time_str)
-    for mission in pak_orders.artillery_missions:
-        log("pakistan", f"💣 ARTY: {mission.get('rounds', '?')} rounds → {mission.get('target_id')}", time_str)
-    for order in pak_orders.ground_orders:
-        log("pakistan", f"🪖 GROUND: {order.get('unit_id')} → {order.get('action', '?').upper()}", time_str)
-    for mission in pak_orders.sf_missions:
-        log("pakistan", f"🎯 SF: {mission.get('mission_type', '?').upper()} mission", time_str)
-    if pak_orders.ew_missions:
-        log("pakistan", f"📶 EW: {len(pak_orders.ew_missions)} operations", time_str)
-    if pak_orders.drone_missions:
-        log("pakistan", f"🛸 DRONE: {len(pak_orders.drone_missions)} ISR missions", time_str)
-
-    # Execute
-    print("\n--- ⚔️  COMBAT RESOLUTION ---\n")
-    time.sleep(0.2)
-
-    turn_state = turn_mgr.execute_full_turn(india_orders, pak_orders)
-
-    # Report results
-    for report in turn_state.combat_reports:
-        phase = report.get('phase', 'combat').replace('_', ' ').upper()
-        attacker = report.get('attacker_id', '?')
-        defender = report.get('defender_id', '?')
-        result = str(report.get('result', '')).replace('CombatResult.', '')
-
-        att_losses = report.get('attacker_losses', {})
-        def_losses = report.get('defender_losses', {})
-        damage = report.get('defender_damage', 0)
-
-        # Determine who won for coloring
-        if 'VICTORY' in result:
-            log("combat", f"{phase}: {attacker} ➜ {defender} = {result}", time_str)
-        elif 'DEFEAT' in result:
-            log("combat", f"{phase}: {attacker} ➜ {defender} = {result}", time_str)
+    # Skip the LLM for a side that cannot or need not act this turn
+    idle = {
+        name: idle_reason(faction, agents[name], states[name], units)
+        for name, faction, *_ in _COMMANDS
+    }
+
+    # All commands plan concurrently: they only read pre-turn state
+    for name, _, _, war_room in _COMMANDS:
+        if not idle[name]:
+            game_log.log("system", f"{war_room} convening...", time_str)
+    sys.stdout.flush()  # show the turn so far while the agents think
+    planned = await plan(
+        [(name, None if idle[name] else agents[name], states[name]) for name, *_ in _COMMANDS],
+        previous_reports,
+    )
+    orders = {name: faction_orders for (name, *_), faction_orders in zip(_COMMANDS, planned)}
+    game_log.log("system", "Orders cache: " + " | ".join(
+        f"{name.title()} {cache_status(agents[name], idle[name])}" for name, *_ in _COMMANDS
+    ), time_str)
+
+    # Each command's reasoning and orders
+    for name, _, banner, _ in _COMMANDS:
+        game_log.emit(f"\n--- {banner} ---\n")
+        reasoning = agents[name].get_reasoning()
+        if idle[name]:
+            game_log.log(name, idle[name], time_str)
         else:
-            log("combat", f"{phase}: {attacker} ➜ {defender} = {result}", time_str)
+            game_log.log(name, f"{reasoning[:250]}..." if reasoning else "Orders issued.", time_str)
 
-        # Losses
-        losses = []
-        if att_losses.get('aircraft'):
-            losses.append(f"Attacker -{att_losses['aircraft']} aircraft")
-        if def_losses.get('aircraft'):
-            losses.append(f"Defender -{def_losses['aircraft']} aircraft")
-        if damage and damage > 0:
-            losses.append(f"Damage: {damage:.0f}")
-        if losses:
-            print(f"         └─ {' | '.join(losses)}")
+        log_orders(game_log, name, orders[name], time_str)
 
-        time.sleep(0.1)
+    # Execute
+    game_log.emit("\n--- ⚔️  COMBAT RESOLUTION ---\n")
+    await game_log.pause(0.2)
+
+    # Report results as each phase resolves
+    for _, reports in turn_mgr.iter_full_turn(orders["india"], orders["pakistan"]):
+        for report in reports:
+            phase = report.get('phase', 'combat').replace('_', ' ').upper()
+            attacker = report.get('attacker_id', '?')
+            defender = report.get('defender_id', '?')
+            result = str(report.get('result', '')).replace('CombatResult.', '')
+
+            att_losses = report.get('attacker_losses', {})
+            def_losses = report.get('defender_losses', {})
+            damage = report.get('defender_damage', 0)
+
+            # Determine who won for coloring
+            if 'VICTORY' in result:
+                game_log.log("combat", f"{phase}: {attacker} ➜ {defender} = {result}", time_str)
+            elif 'DEFEAT' in result:
+                game_log.log("combat", f"{phase}: {attacker} ➜ {defender} = {result}", time_str)
+            else:
+                game_log.log("combat", f"{phase}: {attacker} ➜ {defender} = {result}", time_str)
+
+            # Losses
+            losses = []
+            if att_losses.get('aircraft'):
+                losses.append(f"Attacker -{att_losses['aircraft']} aircraft")
+            if def_losses.get('aircraft'):
+                losses.append(f"Defender -{def_losses['aircraft']} aircraft")
+            if damage and damage > 0:
+                losses.append(f"Damage: {damage:.0f}")
+            if losses:
+                game_log.emit(f"         └─ {' | '.join(losses)}")
+
+        await game_log.pause(0.1 * len(reports))
+
+    turn_state = turn_mgr.current_turn
 
     # Summary
-    india_effective = len([u for u in units.units.values() if u.faction == Faction.INDIA and u.is_combat_effective()])
-    pak_effective = len([u for u in units.units.values() if u.faction == Faction.PAKISTAN and u.is_combat_effective()])
+    india_effective = units.count_effective(Faction.INDIA)
+    pak_effective = units.count_effective(Faction.PAKISTAN)
 
-    print(f"\n📊 Turn {turn_num} Summary: {len(turn_state.combat_reports)} engagements")
-    print(f"   India effective units: {india_effective} | Pakistan: {pak_effective}")
-    print(f"   VP: India {turn_mgr.game_state.india_vp} - Pakistan {turn_mgr.game_state.pakistan_vp}")
+    game_log.emit(f"\n📊 Turn {turn_num} Summary: {len(turn_state.combat_reports)} engagements")
+    game_log.emit(f"   India effective units: {india_effective} | Pakistan: {pak_effective}")
+    game_log.emit(f"   VP: India {turn_mgr.game_state.india_vp} - Pakistan {turn_mgr.game_state.pakistan_vp}")
 
     return turn_state
 
 
 # Main
-print("Initializing simulation...")
-data_path = Path("data")
-hex_map = HexMap(data_path)
-units = UnitManager(data_path)
-units.load_faction_oob(Faction.INDIA)
-units.load_faction_oob(Faction.PAKISTAN)
-logistics = LogisticsSystem()
-fog = FogOfWar()
-turn_mgr = TurnManager(hex_map, units, logistics, fog, data_path)
-turn_mgr.initialize_game()
-
-india_agent = IndiaAgent(AgentConfig(faction="india", doctrine="offensive", model="gpt-4o"))
-pak_agent = PakistanAgent(AgentConfig(faction="pakistan", doctrine="defensive", model="gpt-4o"))
-
-log_header("INDIA-PAKISTAN CONFLICT - OPERATION BEGINS")
-print(f"Running {MAX_TURNS} turns...\n")
-
-for turn in range(1, MAX_TURNS + 1):
-    run_turn(turn_mgr, india_agent, pak_agent, units, turn)
-    if turn < MAX_TURNS:
-        print("\n" + "-"*70)
-        time.sleep(0.5)
-
-log_header("SIMULATION PAUSED")
-print(f"Completed {MAX_TURNS} turns.")
-print(f"Final VP: India {turn_mgr.game_state.india_vp} - Pakistan {turn_mgr.game_state.pakistan_vp}")
+
+
+async def run_simulation(tag="", response_cache=False, fast_model=None, plan=plan_live):
+    """Play one game of MAX_TURNS turns with its own map, units and agents.
+
+    tag (e.g. "GAME 2") prefixes every line the game logs.
+    """
+    game_log = GameLog(tag)
+    game_log.emit("Initializing simulation...")
+    data_path = Path("data")
+    hex_map = HexMap(data_path)
+    units = UnitManager(data_path)
+    units.load_faction_oob(Faction.INDIA)
+    units.load_faction_oob(Faction.PAKISTAN)
+    logistics = LogisticsSystem()
+    fog = FogOfWar()
+    turn_mgr = TurnManager(hex_map, units, logistics, fog, data_path)
+    turn_mgr.initialize_game()
+
+    india_agent = IndiaAgent(AgentConfig(faction="india", doctrine="offensive", model="gpt-4o",
+                                         fast_model=fast_model, response_cache=response_cache))
+    pak_agent = PakistanAgent(AgentConfig(faction="pakistan", doctrine="defensive", model="gpt-4o",
+                                          fast_model=fast_model, response_cache=response_cache,
+                                          hold_when_blind=True))
+
+    game_log.header("INDIA-PAKISTAN CONFLICT - OPERATION BEGINS")
+    game_log.emit(f"Running {MAX_TURNS} turns...\n")
+
+    for turn in range(1, MAX_TURNS + 1):
+        await run_turn(turn_mgr, india_agent, pak_agent, units, turn, plan, game_log)
+        flush_log_file()
+        if turn < MAX_TURNS:
+            game_log.emit("\n" + "-"*70)
+            await game_log.pause(0.5)
+
+    game_log.header("SIMULATION PAUSED")
+    game_log.emit(f"Completed {MAX_TURNS} turns.")
+    game_log.emit(f"Final VP: India {turn_mgr.game_state.india_vp} - Pakistan {turn_mgr.game_state.pakistan_vp}")
+    return turn_mgr.game_state
+
+
+async def main(replays=1, concurrency=1, batch=False, response_cache=False, fast_model=None):
+    """Run replays games, at most concurrency of them at a time.
+
+    With batch, all games run in lockstep and each turn's orders for every
+    game come from one Batch API request (half price, minutes per turn).
+    response_cache replays stored orders for identical queries in a single
+    game; every game starts from the same state, so it trades run-to-run
+    variety for cost and is off unless asked for. fast_model, if given,
+    plans quiet turns with that cheaper model.
+    """
+    # Block-buffer stdout even on a terminal; run_turn flushes at phase boundaries
+    sys.stdout.reconfigure(line_buffering=False)
+
+    plan = plan_live
+    if batch:
+        plan = BatchPlanner(replays).plan
+        concurrency = replays
+    sem = asyncio.Semaphore(concurrency)
+
+    async def bounded(index):
+        async with sem:
+            if replays == 1:
+                return await run_simulation(response_cache=response_cache, fast_model=fast_model, plan=plan)
+            # Replays sample independent games; an exact-match response
+            # cache would hand every game the first game's orders
+            return await run_simulation(f"GAME {index + 1}", response_cache=False, fast_model=fast_model, plan=plan)
+
+    # One event loop for the whole run: the shared async client's pool is bound to it
+    try:
+        return await asyncio.gather(*(bounded(i) for i in range(replays)))
+    finally:
+        await aclose_async_client()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Live India-Pakistan battle log")
+    parser.add_argument("--replays", type=int, default=1, help="Number of games to play")
+    parser.add_argument("--concurrency", type=int, default=1, help="Games played at the same time")
+    parser.add_argument("--batch", action="store_true",
+                        help="Plan each turn of all games with one Batch API request (offline runs)")
+    parser.add_argument("--response-cache", action="store_true",
+                        help="Replay stored orders for identical queries (single game only; ~/.wargame/cache)")
+    parser.add_argument("--fast-model", metavar="MODEL",
+                        help="Plan quiet turns with this cheaper model, e.g. gpt-4o-mini")
+
+    args = parser.parse_args()
+    asyncio.run(main(args.replays, args.concurrency, args.batch, args.response_cache, args.fast_model))
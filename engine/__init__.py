@@ -10,28 +10,41 @@ Core modules:
 - fog_of_war: Visibility and information
 """
 
-from .map import HexMap, HexCell, TerrainType, Weather
-from .units import (
-    UnitManager, Unit, AircraftSquadron, Airbase, MissileBattery,
-    Faction, UnitCategory, UnitStatus, Posture
-)
-from .logistics import LogisticsSystem, SupplyNode, SupplyRoute
-from .fog_of_war import FogOfWar, IntelQuality, IntelReport, SensorCoverage
-from .turn import TurnManager, GameState, Orders, Phase, TimeOfDay
-from .costs import CostTracker
-
-__all__ = [
+from importlib import import_module
+
+# Public name -> submodule defining it. Submodules are imported on first
+# attribute access (PEP 562), so e.g. `from engine import HexMap` does not
+# pull in the turn manager and every combat module.
+_EXPORTS = {
     # Map
-    "HexMap", "HexCell", "TerrainType", "Weather",
+    "HexMap": "map", "HexCell": "map", "TerrainType": "map", "Weather": "map",
     # Units
-    "UnitManager", "Unit", "AircraftSquadron", "Airbase", "MissileBattery",
-    "Faction", "UnitCategory", "UnitStatus", "Posture",
+    "UnitManager": "units", "Unit": "units", "AircraftSquadron": "units",
+    "Airbase": "units", "MissileBattery": "units",
+    "Faction": "units", "UnitCategory": "units", "UnitStatus": "units", "Posture": "units",
     # Logistics
-    "LogisticsSystem", "SupplyNode", "SupplyRoute",
+    "LogisticsSystem": "logistics", "SupplyNode": "logistics", "SupplyRoute": "logistics",
     # Fog of War
-    "FogOfWar", "IntelQuality", "IntelReport", "SensorCoverage",
+    "FogOfWar": "fog_of_war", "IntelQuality": "fog_of_war",
+    "IntelReport": "fog_of_war", "SensorCoverage": "fog_of_war",
     # Turn Management
-    "TurnManager", "GameState", "Orders", "Phase", "TimeOfDay",
+    "TurnManager": "turn", "GameState": "turn", "Orders": "turn", "Phase": "turn", "TimeOfDay": "turn",
     # Cost Tracking
-    "CostTracker",
-]
+    "CostTracker": "costs",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,22 +4,32 @@ Combat resolution modules for each warfare domain.
 Phase order: missiles → EW/cyber → air → drones → artillery → helicopters → ground → SF
 """
 
-from .missiles import MissileCombat
-from .ew import ElectronicWarfare
-from .air import AirCombat
-from .drones import DroneCombat
-from .artillery import ArtilleryCombat
-from .helicopters import HelicopterCombat
-from .ground import GroundCombat
-from .special_forces import SpecialForcesCombat
-
-__all__ = [
-    "MissileCombat",
-    "ElectronicWarfare",
-    "AirCombat",
-    "DroneCombat",
-    "ArtilleryCombat",
-    "HelicopterCombat",
-    "GroundCombat",
-    "SpecialForcesCombat",
-]
+from importlib import import_module
+
+# Public name -> submodule, imported on first attribute access (PEP 562)
+_EXPORTS = {
+    "MissileCombat": "missiles",
+    "ElectronicWarfare": "ew",
+    "AirCombat": "air",
+    "DroneCombat": "drones",
+    "ArtilleryCombat": "artillery",
+    "HelicopterCombat": "helicopters",
+    "GroundCombat": "ground",
+    "SpecialForcesCombat": "special_forces",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -10,10 +10,10 @@ Handles:
 
 from dataclasses import dataclass, field
 from typing import Optional
-from .base import CombatResolver, CombatReport, CombatResult
+from .base import CombatResolver, CombatReport
 
 
-@dataclass
+@dataclass(slots=True)
 class AirMission:
     """An air mission being executed."""
     squadron_id: str
@@ -25,7 +25,7 @@ class AirMission:
     loadout: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AirEngagement:
     """Result of an air-to-air engagement."""
     attacker_losses: int
@@ -59,6 +59,12 @@ class AirCombat(CombatResolver):
         "mica_ir": {"pk": 0.85, "agility": 85},
     }
 
+    # Aircraft carrying these (SCALP, BrahMos-A, Kh-59, Ra'ad, HAMMER) launch
+    # from outside SAM range and never enter the engagement zone
+    STANDOFF_WEAPONS = frozenset({
+        "scalp", "storm_shadow", "brahmos_air", "kh59", "hammer", "raad", "harpoon",
+    })
+
     def resolve_air_to_air(
         self,
         attacker: AirMission,
@@ -160,75 +166,49 @@ class AirCombat(CombatResolver):
         attacker_detects = (attacker_radar - defender_stealth) / 100.0
         defender_detects = (defender_radar - attacker_stealth) / 100.0
 
+        # Missile Pk per shot; constant for the whole BVR phase
+        base_pk = 0.75  # Average BVR PK
+        attacker_pk = base_pk * attacker_detects * (1.0 - defender_ew / 200.0) * weather_modifier
+        defender_pk = base_pk * defender_detects * (1.0 - attacker_ew / 200.0) * weather_modifier
+
+        counts = {"attacker": attacker.aircraft_count, "defender": defender.aircraft_count}
+        alive = dict(counts)
+        # Each side as shooter: (shooter, target, detection, Pk)
+        shooters = (
+            ("attacker", "defender", attacker_detects, attacker_pk),
+            ("defender", "attacker", defender_detects, defender_pk),
+        )
+
         # Standoff / first-look: side with better radar can engage from BVR before the other
         # can effectively respond (e.g. Rafale from own airspace, defender still closing).
-        if attacker_detects > defender_detects:
-            # Attacker has first look — gets 1–2 standoff salvos (only attacker shoots)
-            standoff_salvos = 2 if attacker_detects >= defender_detects * 1.5 else 1
-            for _ in range(standoff_salvos):
-                att_remaining = attacker.aircraft_count - result["attacker_losses"]
-                def_remaining = defender.aircraft_count - result["defender_losses"]
-                if att_remaining <= 0 or def_remaining <= 0:
-                    break
-                missiles = min(2, att_remaining)
-                for _ in range(missiles):
-                    if result["defender_losses"] >= defender.aircraft_count:
-                        break
-                    base_pk = 0.75
-                    pk = base_pk * attacker_detects * (1.0 - defender_ew / 200.0) * weather_modifier
-                    if self.hit_check(pk):
-                        result["defender_losses"] += 1
-        elif defender_detects > attacker_detects:
-            # Defender has first look — gets 1–2 standoff salvos (only defender shoots)
-            standoff_salvos = 2 if defender_detects >= attacker_detects * 1.5 else 1
+        if attacker_detects != defender_detects:
+            shooter, target, detects, pk = max(shooters, key=lambda side: side[2])
+            other_detects = min(attacker_detects, defender_detects)
+            # First-look side gets 1–2 standoff salvos (only it shoots)
+            standoff_salvos = 2 if detects >= other_detects * 1.5 else 1
             for _ in range(standoff_salvos):
-                att_remaining = attacker.aircraft_count - result["attacker_losses"]
-                def_remaining = defender.aircraft_count - result["defender_losses"]
-                if att_remaining <= 0 or def_remaining <= 0:
+                if min(alive.values()) <= 0:
                     break
-                missiles = min(2, def_remaining)
-                for _ in range(missiles):
-                    if result["attacker_losses"] >= attacker.aircraft_count:
-                        break
-                    base_pk = 0.75
-                    pk = base_pk * defender_detects * (1.0 - attacker_ew / 200.0) * weather_modifier
-                    if self.hit_check(pk):
-                        result["attacker_losses"] += 1
+                self._bvr_salvo(alive, target, min(2, alive[shooter]), pk)
 
         # BVR exchanges (mutual: 2 salvos each, both sides can shoot)
         for salvo in range(2):
-            att_remaining = attacker.aircraft_count - result["attacker_losses"]
-            def_remaining = defender.aircraft_count - result["defender_losses"]
-
-            if att_remaining <= 0 or def_remaining <= 0:
+            if min(alive.values()) <= 0:
                 break
 
-            # Attacker salvo
-            missiles = min(2, att_remaining)
-            for _ in range(missiles):
-                if result["defender_losses"] >= defender.aircraft_count:
-                    break
-                base_pk = 0.75  # Average BVR PK
-                pk = base_pk * attacker_detects * (1.0 - defender_ew / 200.0) * weather_modifier
-                if self.hit_check(pk):
-                    result["defender_losses"] += 1
-
-            # Defender salvo
-            missiles = min(2, def_remaining)
-            for _ in range(missiles):
-                if result["attacker_losses"] >= attacker.aircraft_count:
-                    break
-                base_pk = 0.75
-                pk = base_pk * defender_detects * (1.0 - attacker_ew / 200.0) * weather_modifier
-                if self.hit_check(pk):
-                    result["attacker_losses"] += 1
-
-        # Cap losses to actual aircraft count
-        result["attacker_losses"] = min(result["attacker_losses"], attacker.aircraft_count)
-        result["defender_losses"] = min(result["defender_losses"], defender.aircraft_count)
+            # Both sides fire with the aircraft they had at the start of the salvo
+            missiles = {side: min(2, count) for side, count in alive.items()}
+            for shooter, target, _, pk in shooters:
+                self._bvr_salvo(alive, target, missiles[shooter], pk)
 
+        result["attacker_losses"] = counts["attacker"] - alive["attacker"]
+        result["defender_losses"] = counts["defender"] - alive["defender"]
         return result
 
+    def _bvr_salvo(self, alive: dict, target: str, missiles: int, pk: float):
+        """Fire one BVR salvo at target ("attacker" or "defender")."""
+        alive[target] = max(0, alive[target] - self.hit_count(missiles, pk))
+
     def _resolve_wvr(
         self,
         attacker_count: int,
@@ -252,44 +232,55 @@ class AirCombat(CombatResolver):
         attacker_speed = attacker_stats.get("speed", 75)
         defender_speed = defender_stats.get("speed", 75)
 
+        # Shot Pk, constant across rounds
+        att_pk = (attacker_a2a / 100.0) * (attacker_speed / defender_speed) * 0.3 * weather_modifier
+        def_pk = (defender_a2a / 100.0) * (defender_speed / attacker_speed) * 0.3 * weather_modifier
+
         # Combat rounds
         rounds = min(3, max(attacker_count, defender_count))
 
+        att_alive, def_alive = attacker_count, defender_count
         for _ in range(rounds):
-            remaining_att = attacker_count - result["attacker_losses"]
-            remaining_def = defender_count - result["defender_losses"]
-
-            if remaining_att <= 0 or remaining_def <= 0:
+            if att_alive <= 0 or def_alive <= 0:
                 break
 
-            # Attacker shots
-            att_pk = (attacker_a2a / 100.0) * (attacker_speed / defender_speed) * 0.3 * weather_modifier
-            for _ in range(remaining_att):
-                if result["defender_losses"] >= defender_count:
-                    break
-                if self.hit_check(att_pk):
-                    if self.hit_check(0.7):  # Kill vs damage
-                        result["defender_losses"] += 1
-                    else:
-                        result["defender_damaged"] += 1
-
-            # Defender shots
-            def_pk = (defender_a2a / 100.0) * (defender_speed / attacker_speed) * 0.3 * weather_modifier
-            for _ in range(remaining_def):
-                if result["attacker_losses"] >= attacker_count:
-                    break
-                if self.hit_check(def_pk):
-                    if self.hit_check(0.7):
-                        result["attacker_losses"] += 1
-                    else:
-                        result["attacker_damaged"] += 1
+            # Both sides fire with the aircraft they had at the start of the round
+            def_kills, damaged = self._wvr_volley(att_alive, att_pk, def_alive)
+            result["defender_damaged"] += damaged
+            att_kills, damaged = self._wvr_volley(def_alive, def_pk, att_alive)
+            result["attacker_damaged"] += damaged
 
-        # Final cap
-        result["attacker_losses"] = min(result["attacker_losses"], attacker_count)
-        result["defender_losses"] = min(result["defender_losses"], defender_count)
+            att_alive -= att_kills
+            def_alive -= def_kills
 
+        result["attacker_losses"] = attacker_count - att_alive
+        result["defender_losses"] = defender_count - def_alive
         return result
 
+    def _wvr_volley(self, shots: int, pk: float, targets: int) -> tuple[int, int]:
+        """Fire one side's WVR shots; return (kills, damaged) among the targets.
+
+        Each hit kills 70% of the time and otherwise damages. Shooting stops
+        at the kill that downs the last target, so when a volley wipes the
+        targets out only the damage landed before that kill counts.
+        """
+        hits = self.hit_count(shots, pk)
+        kills = self.hit_count(hits, 0.7)
+        if kills < targets:
+            return kills, hits - kills
+
+        outcomes = [True] * kills + [False] * (hits - kills)
+        self.rng.shuffle(outcomes)
+        kills = damaged = 0
+        for killed in outcomes:
+            if killed:
+                kills += 1
+                if kills == targets:
+                    break
+            else:
+                damaged += 1
+        return kills, damaged
+
     def resolve_strike(
         self,
         striker: AirMission,
@@ -305,16 +296,15 @@ class AirCombat(CombatResolver):
         losses_to_sam = 0
 
         # Phase 1: SAM engagement during ingress
-        # Aircraft with standoff weapons (SCALP, BrahMos-A, Kh-59, Ra'ad, HAMMER)
-        # launch from outside SAM range and never enter the engagement zone.
         # Only aircraft doing direct overfly attacks face SAMs.
-        STANDOFF_WEAPONS = {"scalp", "storm_shadow", "brahmos_air", "kh59", "hammer",
-                            "raad", "harpoon"}
-        aircraft_weapons = set(striker_stats.get("weapons", []))
-        has_standoff = bool(aircraft_weapons & STANDOFF_WEAPONS)
+        has_standoff = not self.STANDOFF_WEAPONS.isdisjoint(striker_stats.get("weapons", ()))
 
         if not has_standoff:
             # Legacy strike (Jaguar, MiG-21, etc.) — must penetrate SAM zone
+            # EW suite and stealth degrade every SAM shot alike
+            survivability = (1.0 - striker_stats.get("ew_suite", 50) / 200.0)
+            survivability *= (1.0 - striker_stats.get("stealth", 15) / 200.0)
+
             for sam in sam_coverage:
                 if aircraft_count <= 0:
                     break
@@ -324,47 +314,26 @@ class AirCombat(CombatResolver):
 
                 # 1 engagement per aircraft per SAM battery
                 engagements = min(sam_rounds // 2, aircraft_count)
-                engagements = min(engagements, aircraft_count)
-
-                for _ in range(engagements):
-                    pk = sam_effectiveness * weather_modifier
-                    pk *= (1.0 - striker_stats.get("ew_suite", 50) / 200.0)
-                    stealth = striker_stats.get("stealth", 15)
-                    pk *= (1.0 - stealth / 200.0)
 
-                    if self.hit_check(pk):
-                        losses_to_sam += 1
-                        aircraft_count -= 1
+                pk = sam_effectiveness * weather_modifier * survivability
+                kills = self.hit_count(engagements, pk)
+                losses_to_sam += kills
+                aircraft_count -= kills
         # else: standoff launch — aircraft stays outside SAM envelope, zero SAM exposure
 
         # Phase 2: Strike delivery
         remaining = striker.aircraft_count - losses_to_sam
         ground_attack = striker_stats.get("ground_attack", 70)
 
-        hits = 0
-        total_damage = 0.0
-
-        for _ in range(remaining):
-            # Each aircraft delivers ordnance
-            hit_chance = (ground_attack / 100.0) * weather_modifier
-            if self.hit_check(hit_chance):
-                hits += 1
-                damage = self.roll(ground_attack * 0.5, variance=0.25)
-                total_damage += damage
+        # Each aircraft delivers ordnance
+        hit_chance = (ground_attack / 100.0) * weather_modifier
+        hits = self.hit_count(remaining, hit_chance)
+        total_damage = sum((self.roll(ground_attack * 0.5, variance=0.25) for _ in range(hits)), 0.0)
 
         # Result based on damage vs target defense
         effectiveness = total_damage / max(1, target_defense)
 
-        if effectiveness >= 1.5:
-            result = CombatResult.DECISIVE_VICTORY
-        elif effectiveness >= 1.0:
-            result = CombatResult.VICTORY
-        elif effectiveness >= 0.5:
-            result = CombatResult.MARGINAL
-        elif hits > 0:
-            result = CombatResult.STALEMATE
-        else:
-            result = CombatResult.DEFEAT
+        result = self.strike_result(effectiveness, hits > 0)
 
         report = CombatReport(
             attacker_id=striker.squadron_id,
@@ -399,36 +368,20 @@ class AirCombat(CombatResolver):
         sam_rounds = target_sam.get("rounds", 20)
         sam_effectiveness = target_sam.get("effectiveness", 0.3)
 
-        losses = 0
-        sam_damage = 0.0
-
         # SAM shoots at SEAD aircraft — 1 engagement per aircraft
         engagements = min(sam_rounds // 2, aircraft_count)
-        engagements = min(engagements, aircraft_count)
-        for _ in range(engagements):
-            pk = sam_effectiveness * (1.0 - striker_stats.get("ew_suite", 50) / 200.0)
-            pk *= (1.0 - striker_stats.get("stealth", 15) / 200.0)
-            if self.hit_check(pk):
-                losses += 1
-                aircraft_count -= 1
+        pk = sam_effectiveness * (1.0 - striker_stats.get("ew_suite", 50) / 200.0)
+        pk *= (1.0 - striker_stats.get("stealth", 15) / 200.0)
+        losses = self.hit_count(engagements, pk)
 
         # SEAD aircraft fire ARMs
         remaining = striker.aircraft_count - losses
-        for _ in range(remaining):
-            # ARM effectiveness
-            arm_pk = 0.65 * (striker_stats.get("radar", 70) / 100.0)
-            if self.hit_check(arm_pk):
-                sam_damage += self.roll(40, 0.2)
+        arm_pk = 0.65 * (striker_stats.get("radar", 70) / 100.0)  # ARM effectiveness
+        arm_hits = self.hit_count(remaining, arm_pk)
+        sam_damage = sum((self.roll(40, 0.2) for _ in range(arm_hits)), 0.0)
 
         # Assess SAM damage
-        if sam_damage >= 80:
-            result = CombatResult.DECISIVE_VICTORY
-        elif sam_damage >= 50:
-            result = CombatResult.VICTORY
-        elif sam_damage >= 25:
-            result = CombatResult.MARGINAL
-        else:
-            result = CombatResult.STALEMATE
+        result = self.sead_result(sam_damage)
 
         report = CombatReport(
             attacker_id=striker.squadron_id,
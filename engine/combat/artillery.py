@@ -9,11 +9,31 @@ Handles:
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
-from .base import CombatResolver, CombatReport, CombatResult
+from .base import CombatResolver, CombatReport
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _classify_unit_type(unit_type: str) -> str:
+    """Map a unit type to its artillery target class (memoized per raw type string).
+
+    Infantry is split into dug-in and in-the-open by the caller, since that
+    depends on unit state rather than type.
+    """
+    unit_type = unit_type.lower()
+
+    if "armor" in unit_type or "tank" in unit_type:
+        return "armor"
+    elif "mech" in unit_type:
+        return "mechanized"
+    elif "artillery" in unit_type:
+        return "artillery"
+    else:
+        return "infantry"
+
+
+@dataclass(slots=True)
 class FireMission:
     """An artillery fire mission."""
     battery_id: str
@@ -24,7 +44,7 @@ class FireMission:
     mission_type: str  # "bombardment", "suppression", "counter_battery", "smoke"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ArtilleryEffect:
     """Effect of artillery fire."""
     casualties: int
@@ -103,11 +123,8 @@ class ArtilleryCombat(CombatResolver):
         else:
             effective_rounds = mission.rounds
 
-        hits = 0
-        for _ in range(int(effective_rounds)):
-            hit_chance = (accuracy / 100.0) * concealment_mod
-            if self.hit_check(hit_chance):
-                hits += 1
+        hit_chance = (accuracy / 100.0) * concealment_mod
+        hits = self.hit_count(int(effective_rounds), hit_chance)
 
         # Calculate damage
         base_damage = hits * damage * vulnerability
@@ -143,16 +160,7 @@ class ArtilleryCombat(CombatResolver):
 
         # Determine result
         effectiveness = base_damage / 100.0
-        if effectiveness >= 1.5:
-            result = CombatResult.DECISIVE_VICTORY
-        elif effectiveness >= 1.0:
-            result = CombatResult.VICTORY
-        elif effectiveness >= 0.5:
-            result = CombatResult.MARGINAL
-        elif hits > 0:
-            result = CombatResult.STALEMATE
-        else:
-            result = CombatResult.DEFEAT
+        result = self.strike_result(effectiveness, hits > 0)
 
         report = CombatReport(
             attacker_id=mission.battery_id,
@@ -181,14 +189,9 @@ class ArtilleryCombat(CombatResolver):
         if target_unit is None:
             return "fortification"
 
-        unit_type = target_unit.unit_type.lower()
-
-        if "armor" in unit_type or "tank" in unit_type:
-            return "armor"
-        elif "mech" in unit_type:
-            return "mechanized"
-        elif "artillery" in unit_type:
-            return "artillery"
+        target_type = _classify_unit_type(target_unit.unit_type)
+        if target_type != "infantry":
+            return target_type
         elif target_unit.state.dug_in >= 2:
             return "infantry_dug_in"
         else:
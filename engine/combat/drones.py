@@ -9,11 +9,33 @@ Handles:
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 from .base import CombatResolver, CombatReport, CombatResult
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _classify_unit_type(unit_type: str) -> str:
+    """Map a unit type to its drone target class (memoized per raw type string)."""
+    unit_type = unit_type.lower()
+
+    if "radar" in unit_type:
+        return "radar"
+    elif "sam" in unit_type or "air_defense" in unit_type:
+        return "sam_site"
+    elif "artillery" in unit_type:
+        return "artillery"
+    elif "command" in unit_type or "hq" in unit_type:
+        return "command_post"
+    elif "armor" in unit_type:
+        return "armor"
+    elif "logistics" in unit_type:
+        return "logistics"
+    else:
+        return "infantry"
+
+
+@dataclass(slots=True)
 class DroneMission:
     """A drone mission."""
     unit_id: str
@@ -25,7 +47,7 @@ class DroneMission:
     loiter_time_hours: float = 0  # For loitering munitions
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DroneEngagement:
     """Result of drone operations."""
     drones_lost: int
@@ -40,6 +62,10 @@ class DroneCombat(CombatResolver):
     def __init__(self, swarm_config: dict = None, rng_seed=None):
         super().__init__(rng_seed)
         self.swarm_config = swarm_config or {}
+        # SAM type -> (base_pk, intercept_capacity) from swarm_config, or None
+        self._saturation_profiles: dict[str, Optional[tuple[float, int]]] = {}
+        # Target unit type -> VULNERABILITY of its class (None for no target)
+        self._vulnerabilities: dict[Optional[str], float] = {}
 
     # Drone characteristics
     DRONE_STATS = {
@@ -58,6 +84,7 @@ class DroneCombat(CombatResolver):
         "switchblade": {"type": "loitering", "damage": 40, "accuracy": 80, "stealth": 70},
         "hero_120": {"type": "loitering", "damage": 60, "accuracy": 82, "stealth": 65},
     }
+    DEFAULT_STRIKE_STATS = {"type": "ucav", "damage": 60, "accuracy": 70, "stealth": 40}
 
     # Target vulnerability
     VULNERABILITY = {
@@ -82,39 +109,34 @@ class DroneCombat(CombatResolver):
         """Resolve drone strike mission."""
 
         drone_type = mission.drone_type.lower()
-        stats = self.DRONE_STATS.get(drone_type, {
-            "type": "ucav", "damage": 60, "accuracy": 70, "stealth": 40
-        })
-        stats.update(drone_stats)
+        stats = self.DRONE_STATS.get(drone_type, self.DEFAULT_STRIKE_STATS)
+        if drone_stats:
+            # Merge into a copy: the DRONE_STATS entry is shared by every mission
+            stats = {**stats, **drone_stats}
 
         drone_count = mission.drone_count
         losses = 0
 
         is_loitering = stats.get("type") == "loitering"
 
+        # Drone stealth reduces detection
+        ad_modifier = 1.0 - (stats.get("stealth", 40) / 200.0)
+
+        # Small drones harder to hit
+        if is_loitering:
+            ad_modifier *= 0.6
+
+        # EW degradation affects AD tracking
+        ad_modifier *= (1.0 - ew_degradation)
+
         # Air defense engagement
         for ad in air_defense_coverage:
             if drone_count <= losses:
                 break
 
-            ad_effectiveness = ad.get("effectiveness", 0.5)
-
-            # Drone stealth reduces detection
-            stealth = stats.get("stealth", 40)
-            detection_mod = 1.0 - (stealth / 200.0)
-            ad_effectiveness *= detection_mod
-
-            # Small drones harder to hit
-            if is_loitering:
-                ad_effectiveness *= 0.6
-
-            # EW degradation affects AD tracking
-            ad_effectiveness *= (1.0 - ew_degradation)
-
+            ad_effectiveness = ad.get("effectiveness", 0.5) * ad_modifier
             engagements = min(ad.get("missiles", 4), drone_count - losses)
-            for _ in range(engagements):
-                if self.hit_check(ad_effectiveness):
-                    losses += 1
+            losses += self.hit_count(engagements, ad_effectiveness)
 
         # Strike phase
         surviving = drone_count - losses
@@ -123,8 +145,7 @@ class DroneCombat(CombatResolver):
             return self._create_report(mission, CombatResult.DEFEAT, engagement), engagement
 
         # Target classification
-        target_type = self._classify_target(target_unit)
-        vulnerability = self.VULNERABILITY.get(target_type, 1.0)
+        vulnerability = self._target_vulnerability(target_unit)
 
         # Attack parameters
         accuracy = stats.get("accuracy", 70)
@@ -133,44 +154,27 @@ class DroneCombat(CombatResolver):
         # EW can degrade drone accuracy
         accuracy *= (1.0 - ew_degradation * 0.5)
 
-        targets_destroyed = 0
-        targets_damaged = 0
+        hit_chance = (accuracy / 100.0) * weather_modifier
+        kill_chance = damage / 100.0 * vulnerability
 
         if is_loitering:
             # Loitering munitions are one-shot, one-kill attempts
-            for _ in range(surviving):
-                hit_chance = (accuracy / 100.0) * weather_modifier
-                if self.hit_check(hit_chance):
-                    if self.hit_check(damage / 100.0 * vulnerability):
-                        targets_destroyed += 1
-                    else:
-                        targets_damaged += 1
+            hits = self.hit_count(surviving, hit_chance)
             losses = drone_count  # All expended
         else:
             # UCAVs can carry multiple weapons
             weapons_per_drone = stats.get("weapons", 2)
             total_weapons = surviving * weapons_per_drone
+            hits = self.hit_count(total_weapons, hit_chance)
+            kill_chance *= 0.5
 
-            for _ in range(total_weapons):
-                hit_chance = (accuracy / 100.0) * weather_modifier
-                if self.hit_check(hit_chance):
-                    if self.hit_check(damage / 100.0 * vulnerability * 0.5):
-                        targets_destroyed += 1
-                    else:
-                        targets_damaged += 1
+        # Each hit either destroys or damages its target
+        targets_destroyed = self.hit_count(hits, kill_chance)
+        targets_damaged = hits - targets_destroyed
 
         # Determine result
         effectiveness = (targets_destroyed * 2 + targets_damaged) / max(1, drone_count)
-        if effectiveness >= 1.5:
-            result = CombatResult.DECISIVE_VICTORY
-        elif effectiveness >= 1.0:
-            result = CombatResult.VICTORY
-        elif effectiveness >= 0.5:
-            result = CombatResult.MARGINAL
-        elif targets_destroyed + targets_damaged > 0:
-            result = CombatResult.STALEMATE
-        else:
-            result = CombatResult.DEFEAT
+        result = self.strike_result(effectiveness, targets_destroyed + targets_damaged > 0)
 
         engagement = DroneEngagement(
             drones_lost=losses,
@@ -202,6 +206,8 @@ class DroneCombat(CombatResolver):
 
         # Air defense during loiter
         # Lower chance since ISR drones stay at standoff
+        stealth_modifier = 1.0 - stats.get("stealth", 40) / 200.0
+        draw = self.rng.random
         for ad in air_defense_coverage:
             if drone_count <= losses:
                 break
@@ -212,10 +218,9 @@ class DroneCombat(CombatResolver):
                 continue
 
             ad_effectiveness = ad.get("effectiveness", 0.3) * 0.5
-            stealth = stats.get("stealth", 40)
-            ad_effectiveness *= (1.0 - stealth / 200.0)
+            ad_effectiveness *= stealth_modifier
 
-            if self.hit_check(ad_effectiveness):
+            if draw() < ad_effectiveness:
                 losses += 1
 
         surviving = drone_count - losses
@@ -231,20 +236,27 @@ class DroneCombat(CombatResolver):
             "strength_estimates": {},
         }
 
-        for unit in enemy_units:
-            # Detection chance based on unit concealment
-            unit_concealment = unit.state.dug_in * 15 + 20  # Base concealment
-            detect_chance = (detection_rating / 100.0) * (1.0 - unit_concealment / 200.0)
-
-            if surviving > 0 and self.hit_check(detect_chance):
-                intelligence["units_detected"].append(unit.id)
-                intelligence["positions_confirmed"].append({
+        # Only drones that survived air defense can observe
+        if surviving > 0:
+            detection = detection_rating / 100.0
+            detected = intelligence["units_detected"]
+            positions = intelligence["positions_confirmed"]
+            estimates = intelligence["strength_estimates"]
+            roll = self.roll
+            for unit in enemy_units:
+                # Detection chance based on unit concealment
+                unit_concealment = unit.state.dug_in * 15 + 20  # Base concealment
+                if draw() >= detection * (1.0 - unit_concealment / 200.0):
+                    continue
+
+                detected.append(unit.id)
+                positions.append({
                     "unit_id": unit.id,
                     "location": (unit.location.hex_q, unit.location.hex_r)
                 })
                 # Strength estimate accuracy
-                accuracy = self.roll(0.8, 0.2)
-                intelligence["strength_estimates"][unit.id] = {
+                accuracy = roll(0.8, 0.2)
+                estimates[unit.id] = {
                     "estimated": int(unit.state.strength_current * accuracy),
                     "accuracy": accuracy
                 }
@@ -305,14 +317,9 @@ class DroneCombat(CombatResolver):
         sam_effectiveness = target_sam.get("effectiveness", 0.6)
 
         # Override with YAML swarm saturation mechanics when available
-        if self.swarm_config and "saturation_mechanics" in self.swarm_config:
-            per_system = self.swarm_config["saturation_mechanics"].get("per_system_pk", {})
-            sam_type = target_sam.get("type", "").lower().replace("-", "").replace(" ", "")
-            for sys_key, sys_data in per_system.items():
-                if sys_key in sam_type:
-                    sam_effectiveness = sys_data["base_pk"]
-                    sam_missiles = sys_data["intercept_capacity"]
-                    break
+        profile = self._saturation_profile(target_sam.get("type", ""))
+        if profile:
+            sam_effectiveness, sam_missiles = profile
 
         # Swarm saturation - effectiveness degrades with numbers
         if total_drones > sam_missiles:
@@ -320,32 +327,19 @@ class DroneCombat(CombatResolver):
         else:
             saturation_factor = 1.0
 
-        losses = 0
         # SAM engages swarm
-        for _ in range(min(sam_missiles, total_drones)):
-            pk = sam_effectiveness * saturation_factor * 0.5  # Small targets
-            if self.hit_check(pk):
-                if escort_drones > 0:
-                    escort_drones -= 1  # Escorts sacrificed first
-                else:
-                    losses += 1
+        pk = sam_effectiveness * saturation_factor * 0.5  # Small targets
+        sam_hits = self.hit_count(min(sam_missiles, total_drones), pk)
+        escorts_hit = min(sam_hits, escort_drones)  # Escorts sacrificed first
+        escort_drones -= escorts_hit
+        losses = sam_hits - escorts_hit
 
         # Surviving strike drones attack
         surviving = drone_count - losses
-        sam_damage = 0.0
-
-        for _ in range(surviving):
-            if self.hit_check(0.75):  # Loitering munition hit
-                sam_damage += self.roll(30, 0.2)
-
-        if sam_damage >= 80:
-            result = CombatResult.DECISIVE_VICTORY
-        elif sam_damage >= 50:
-            result = CombatResult.VICTORY
-        elif sam_damage >= 25:
-            result = CombatResult.MARGINAL
-        else:
-            result = CombatResult.STALEMATE
+        munition_hits = self.hit_count(surviving, 0.75)  # Loitering munition hit
+        sam_damage = sum((self.roll(30, 0.2) for _ in range(munition_hits)), 0.0)
+
+        result = self.sead_result(sam_damage)
 
         engagement = DroneEngagement(
             drones_lost=losses + (mission.drone_count - losses),  # All strike drones expended
@@ -369,27 +363,35 @@ class DroneCombat(CombatResolver):
 
         return report, engagement
 
+    def _saturation_profile(self, sam_type: str) -> Optional[tuple[float, int]]:
+        """Get (base_pk, intercept_capacity) for a SAM type from swarm_config, memoized per type."""
+        if sam_type not in self._saturation_profiles:
+            profile = None
+            if "saturation_mechanics" in self.swarm_config:
+                per_system = self.swarm_config["saturation_mechanics"].get("per_system_pk", {})
+                normalized = sam_type.lower().replace("-", "").replace(" ", "")
+                for sys_key, sys_data in per_system.items():
+                    if sys_key in normalized:
+                        profile = (sys_data["base_pk"], sys_data["intercept_capacity"])
+                        break
+            self._saturation_profiles[sam_type] = profile
+        return self._saturation_profiles[sam_type]
+
     def _classify_target(self, target_unit) -> str:
         """Classify target for vulnerability."""
         if target_unit is None:
             return "logistics"
 
-        unit_type = target_unit.unit_type.lower()
-
-        if "radar" in unit_type:
-            return "radar"
-        elif "sam" in unit_type or "air_defense" in unit_type:
-            return "sam_site"
-        elif "artillery" in unit_type:
-            return "artillery"
-        elif "command" in unit_type or "hq" in unit_type:
-            return "command_post"
-        elif "armor" in unit_type:
-            return "armor"
-        elif "logistics" in unit_type:
-            return "logistics"
-        else:
-            return "infantry"
+        return _classify_unit_type(target_unit.unit_type)
+
+    def _target_vulnerability(self, target_unit) -> float:
+        """Vulnerability of a strike target, memoized per unit type."""
+        unit_type = target_unit.unit_type if target_unit is not None else None
+        vulnerability = self._vulnerabilities.get(unit_type)
+        if vulnerability is None:
+            target_type = self._classify_target(target_unit)
+            vulnerability = self._vulnerabilities[unit_type] = self.VULNERABILITY.get(target_type, 1.0)
+        return vulnerability
 
     def _create_report(
         self,
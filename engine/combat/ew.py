@@ -10,11 +10,29 @@ Handles:
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 from .base import CombatResolver, CombatReport, CombatResult
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _classify_unit_type(unit_type: str, category: str) -> str:
+    """Map a unit type to its EW vulnerability class (memoized per type and category)."""
+    unit_type = unit_type.lower()
+
+    if "awacs" in unit_type or "aew" in unit_type:
+        return "awacs"
+    elif "sam" in unit_type or "air_defense" in unit_type:
+        return "sam_radar"
+    elif "aircraft" in unit_type or category == "aircraft":
+        return "fighter"
+    elif "artillery" in unit_type:
+        return "artillery_radar"
+    else:
+        return "ground_comms"
+
+
+@dataclass(slots=True)
 class EWMission:
     """An electronic warfare mission."""
     unit_id: str
@@ -25,7 +43,7 @@ class EWMission:
     duration_turns: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class EWEffect:
     """Effect of electronic warfare."""
     radar_degradation: float = 0.0  # 0-1, reduces detection/tracking
@@ -97,10 +115,12 @@ class ElectronicWarfare(CombatResolver):
             effect.gps_degradation = min(0.9, base_degradation * self.roll(1.0, 0.15))
 
         # Determine affected units
-        for unit in target_units:
-            vulnerability = self._get_vulnerability(unit)
-            if self.hit_check(effective_power / 100.0 * vulnerability):
-                effect.affected_units.append(unit.id)
+        draw = self.rng.random
+        power_fraction = effective_power / 100.0
+        effect.affected_units = [
+            unit.id for unit in target_units
+            if draw() < power_fraction * self._get_vulnerability(unit)
+        ]
 
         # Determine result based on effectiveness
         avg_degradation = (effect.radar_degradation + effect.comms_degradation + effect.gps_degradation) / 3
@@ -257,18 +277,7 @@ class ElectronicWarfare(CombatResolver):
 
     def _get_vulnerability(self, unit) -> float:
         """Get unit's vulnerability to EW."""
-        unit_type = unit.unit_type.lower()
-
-        if "awacs" in unit_type or "aew" in unit_type:
-            return self.VULNERABILITY["awacs"]
-        elif "sam" in unit_type or "air_defense" in unit_type:
-            return self.VULNERABILITY["sam_radar"]
-        elif "aircraft" in unit_type or unit.category.value == "aircraft":
-            return self.VULNERABILITY["fighter"]
-        elif "artillery" in unit_type:
-            return self.VULNERABILITY["artillery_radar"]
-        else:
-            return self.VULNERABILITY["ground_comms"]
+        return self.VULNERABILITY[_classify_unit_type(unit.unit_type, unit.category.value)]
 
     def calculate_area_effect(
         self,
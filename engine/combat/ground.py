@@ -9,11 +9,27 @@ Handles:
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 from .base import CombatResolver, CombatReport, CombatResult
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _classify_unit_type(unit_type: str) -> str:
+    """Map a unit type to its ground combat category (memoized per raw type string)."""
+    unit_type = unit_type.lower()
+
+    if "armor" in unit_type or "tank" in unit_type:
+        return "armor"
+    elif "mech" in unit_type:
+        return "mechanized"
+    elif "mountain" in unit_type:
+        return "mountain"
+    else:
+        return "infantry"
+
+
+@dataclass(slots=True, frozen=True)
 class GroundEngagement:
     """A ground combat engagement."""
     attacker_id: str
@@ -27,7 +43,7 @@ class GroundEngagement:
     urban: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GroundCombatResult:
     """Detailed result of ground combat."""
     attacker_casualties: int
@@ -209,16 +225,7 @@ class GroundCombat(CombatResolver):
 
     def _get_unit_category(self, unit) -> str:
         """Get simplified unit category for combat calculations."""
-        unit_type = unit.unit_type.lower()
-
-        if "armor" in unit_type or "tank" in unit_type:
-            return "armor"
-        elif "mech" in unit_type:
-            return "mechanized"
-        elif "mountain" in unit_type:
-            return "mountain"
-        else:
-            return "infantry"
+        return _classify_unit_type(unit.unit_type)
 
     def apply_combat_results(
         self,
@@ -238,8 +245,7 @@ class GroundCombat(CombatResolver):
         )
 
         if result.defender_retreated:
-            from ..units import UnitStatus
-            defender_unit.status = UnitStatus.RETREATING
+            defender_unit.retreat()
 
     def calculate_breakthrough(
         self,
@@ -9,11 +9,31 @@ Handles:
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 from .base import CombatResolver, CombatReport, CombatResult
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _classify_unit_type(unit_type: str) -> str:
+    """Map a unit type to its helicopter target class (memoized per raw type string)."""
+    unit_type = unit_type.lower()
+
+    if "armor" in unit_type or "tank" in unit_type:
+        return "armor"
+    elif "mech" in unit_type:
+        return "mechanized"
+    elif "artillery" in unit_type:
+        return "artillery"
+    elif "air_defense" in unit_type or "sam" in unit_type:
+        return "air_defense"
+    elif "logistics" in unit_type or "supply" in unit_type:
+        return "logistics"
+    else:
+        return "infantry"
+
+
+@dataclass(slots=True, frozen=True)
 class HelicopterMission:
     """A helicopter mission."""
     unit_id: str
@@ -25,7 +45,7 @@ class HelicopterMission:
     payload: list[str] = field(default_factory=list)  # Troops for air assault
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HelicopterEngagement:
     """Result of helicopter operations."""
     helicopters_lost: int
@@ -52,6 +72,7 @@ class HelicopterCombat(CombatResolver):
         "chinook": {"attack": 20, "defense": 40, "speed": 65, "capacity": 40, "type": "transport"},
         "mi17": {"attack": 30, "defense": 45, "speed": 60, "capacity": 30, "type": "transport"},
     }
+    DEFAULT_ATTACK_STATS = {"attack": 70, "defense": 50, "armor_pen": 70}
 
     # Target vulnerability to helicopter attack
     VULNERABILITY = {
@@ -76,15 +97,18 @@ class HelicopterCombat(CombatResolver):
 
         # Get helicopter characteristics
         heli_type = mission.helicopter_type.lower()
-        stats = self.HELICOPTER_STATS.get(heli_type, {
-            "attack": 70, "defense": 50, "armor_pen": 70
-        })
-        stats.update(heli_stats)
+        stats = self.HELICOPTER_STATS.get(heli_type, self.DEFAULT_ATTACK_STATS)
+        if heli_stats:
+            # Merge into a copy: the HELICOPTER_STATS entry is shared by every mission
+            stats = {**stats, **heli_stats}
 
         helicopter_count = mission.helicopter_count
         losses = 0
         damaged = 0
 
+        # Helicopter defense/evasion
+        defense_mod = stats.get("defense", 50) / 100.0
+
         # Phase 1: Air defense engagement
         for ad in air_defense_coverage:
             if helicopter_count <= losses:
@@ -99,17 +123,13 @@ class HelicopterCombat(CombatResolver):
             elif ad_type in ("sam", "mrsam"):
                 ad_effectiveness *= 0.7  # Less effective
 
-            # Helicopter defense/evasion
-            defense_mod = stats.get("defense", 50) / 100.0
             ad_effectiveness *= (1.0 - defense_mod * 0.5)
 
             engagements = min(ad.get("missiles", 4), helicopter_count - losses)
-            for _ in range(engagements):
-                if self.hit_check(ad_effectiveness):
-                    if self.hit_check(0.7):  # Kill vs damage
-                        losses += 1
-                    else:
-                        damaged += 1
+            ad_hits = self.hit_count(engagements, ad_effectiveness)
+            kills = self.hit_count(ad_hits, 0.7)  # Kill vs damage
+            losses += kills
+            damaged += ad_hits - kills
 
         # Phase 2: Attack run
         surviving = helicopter_count - losses
@@ -134,17 +154,13 @@ class HelicopterCombat(CombatResolver):
         concealment_mod = 1.0 - (terrain_concealment / 200.0)
 
         # Calculate damage
-        hits = 0
-        equipment_destroyed = 0
+        hit_chance = (attack_rating / 100.0) * concealment_mod * weather_modifier
+        hits = self.hit_count(surviving, hit_chance)
 
-        for _ in range(surviving):
-            hit_chance = (attack_rating / 100.0) * concealment_mod * weather_modifier
-            if self.hit_check(hit_chance):
-                hits += 1
-                # Equipment kills (for armor/mech targets)
-                if target_type in ("armor", "mechanized"):
-                    if self.hit_check(armor_pen / 100.0):
-                        equipment_destroyed += 1
+        # Equipment kills (for armor/mech targets)
+        equipment_destroyed = 0
+        if target_type in ("armor", "mechanized"):
+            equipment_destroyed = self.hit_count(hits, armor_pen / 100.0)
 
         # Calculate casualties
         casualty_rate = hits * 0.02 * vulnerability  # 2% per hit base
@@ -152,16 +168,7 @@ class HelicopterCombat(CombatResolver):
 
         # Determine result
         effectiveness = (hits + equipment_destroyed * 2) / max(1, helicopter_count)
-        if effectiveness >= 1.5:
-            result = CombatResult.DECISIVE_VICTORY
-        elif effectiveness >= 1.0:
-            result = CombatResult.VICTORY
-        elif effectiveness >= 0.5:
-            result = CombatResult.MARGINAL
-        elif hits > 0:
-            result = CombatResult.STALEMATE
-        else:
-            result = CombatResult.DEFEAT
+        result = self.strike_result(effectiveness, hits > 0)
 
         engagement = HelicopterEngagement(
             helicopters_lost=losses,
@@ -191,6 +198,9 @@ class HelicopterCombat(CombatResolver):
         lz_risk = {"cold": 0.0, "warm": 0.3, "hot": 0.7}
         risk_level = lz_risk.get(landing_zone_security, 0.3)
 
+        # Troops lost with each downed helicopter
+        troops_per_helo = troops_count // max(1, helicopter_count)
+
         # Air defense during approach
         for ad in air_defense_coverage:
             if helicopter_count <= losses:
@@ -199,26 +209,19 @@ class HelicopterCombat(CombatResolver):
             ad_effectiveness = ad.get("effectiveness", 0.4) * weather_modifier
 
             engagements = min(ad.get("missiles", 4), helicopter_count - losses)
-            for _ in range(engagements):
-                if self.hit_check(ad_effectiveness):
-                    if self.hit_check(0.6):
-                        losses += 1
-                        # Troops lost with helicopter
-                        troops_per_helo = troops_count // helicopter_count
-                        troops_lost += troops_per_helo
-                    else:
-                        damaged += 1
+            ad_hits = self.hit_count(engagements, ad_effectiveness)
+            kills = self.hit_count(ad_hits, 0.6)
+            losses += kills
+            damaged += ad_hits - kills
+            troops_lost += kills * troops_per_helo
 
         # LZ risk (ground fire during landing)
         surviving_helos = helicopter_count - losses
-        for _ in range(surviving_helos):
-            if self.hit_check(risk_level * 0.3):
-                if self.hit_check(0.4):
-                    losses += 1
-                    troops_per_helo = troops_count // helicopter_count
-                    troops_lost += troops_per_helo
-                else:
-                    damaged += 1
+        ground_fire_hits = self.hit_count(surviving_helos, risk_level * 0.3)
+        kills = self.hit_count(ground_fire_hits, 0.4)
+        losses += kills
+        damaged += ground_fire_hits - kills
+        troops_lost += kills * troops_per_helo
 
         # Troops inserted
         troops_inserted = troops_count - troops_lost
@@ -263,20 +266,7 @@ class HelicopterCombat(CombatResolver):
 
     def _classify_target(self, target_unit) -> str:
         """Classify target for vulnerability."""
-        unit_type = target_unit.unit_type.lower()
-
-        if "armor" in unit_type or "tank" in unit_type:
-            return "armor"
-        elif "mech" in unit_type:
-            return "mechanized"
-        elif "artillery" in unit_type:
-            return "artillery"
-        elif "air_defense" in unit_type or "sam" in unit_type:
-            return "air_defense"
-        elif "logistics" in unit_type or "supply" in unit_type:
-            return "logistics"
-        else:
-            return "infantry"
+        return _classify_unit_type(target_unit.unit_type)
 
     def _create_report(
         self,
@@ -9,10 +9,10 @@ Handles:
 
 from dataclasses import dataclass
 from typing import Optional
-from .base import CombatResolver, CombatReport, CombatResult
+from .base import CombatResolver, CombatReport
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MissileStrike:
     """A planned missile strike."""
     battery_id: str
@@ -22,7 +22,7 @@ class MissileStrike:
     missile_type: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InterceptionResult:
     """Result of air defense interception attempt."""
     missiles_incoming: int
@@ -84,6 +84,15 @@ class MissileCombat(CombatResolver):
         "bridge": 100,
     }
 
+    # Share of airbase strike damage taken by each component
+    AIRBASE_DAMAGE_DISTRIBUTION = {
+        "runway": 0.4,
+        "fuel": 0.2,
+        "ammo": 0.15,
+        "shelters": 0.15,
+        "maintenance": 0.1,
+    }
+
     def resolve_strike(
         self,
         strike: MissileStrike,
@@ -110,31 +119,17 @@ class MissileCombat(CombatResolver):
         missiles_through = interception.missiles_leaked
 
         # Phase 2: Strike damage
-        hits = 0
-        total_damage = 0.0
-
-        for _ in range(missiles_through):
-            hit_chance = (missile_stats["accuracy"] / 100.0) * weather_modifier
-            if self.hit_check(hit_chance):
-                hits += 1
-                damage = self.roll(missile_stats["damage"], variance=0.15)
-                total_damage += damage
+        hit_chance = (missile_stats["accuracy"] / 100.0) * weather_modifier
+        hits = self.hit_count(missiles_through, hit_chance)
+        missile_damage = missile_stats["damage"]
+        total_damage = sum((self.roll(missile_damage, variance=0.15) for _ in range(hits)), 0.0)
 
         # Damage vs hardness
         destruction_threshold = target_hardness
         damage_ratio = total_damage / max(1, destruction_threshold)
 
         # Determine result
-        if damage_ratio >= 1.5:
-            result = CombatResult.DECISIVE_VICTORY
-        elif damage_ratio >= 1.0:
-            result = CombatResult.VICTORY
-        elif damage_ratio >= 0.5:
-            result = CombatResult.MARGINAL
-        elif hits > 0:
-            result = CombatResult.STALEMATE
-        else:
-            result = CombatResult.DEFEAT
+        result = self.strike_result(damage_ratio, hits > 0)
 
         report = CombatReport(
             attacker_id=strike.battery_id,
@@ -174,6 +169,9 @@ class MissileCombat(CombatResolver):
         missile_speed = missile_stats.get("speed", "subsonic")
         detectability = missile_stats.get("detectability", 50) / 100.0
 
+        # Detection modifier
+        detect_chance = min(1.0, detectability * 1.5)
+
         for sam in defending_sams:
             if missiles_remaining <= 0:
                 break
@@ -188,9 +186,6 @@ class MissileCombat(CombatResolver):
             effectiveness = self.SAM_EFFECTIVENESS.get(sam_type, {})
             base_intercept = effectiveness.get(missile_speed, 0.5)
 
-            # Detection modifier
-            detect_chance = min(1.0, detectability * 1.5)
-
             # EW degradation
             effective_intercept = base_intercept * ew_modifier * detect_chance
 
@@ -198,14 +193,9 @@ class MissileCombat(CombatResolver):
             rounds_to_use = min(sam_rounds, missiles_remaining * 2)  # 2 rounds per missile
             total_rounds_used += rounds_to_use
 
-            for _ in range(missiles_remaining):
-                if rounds_to_use < 2:
-                    break
-                rounds_to_use -= 2
-
-                if self.hit_check(effective_intercept):
-                    total_intercepted += 1
-                    missiles_remaining -= 1
+            intercepted = self.hit_count(rounds_to_use // 2, effective_intercept)
+            total_intercepted += intercepted
+            missiles_remaining -= intercepted
 
         return InterceptionResult(
             missiles_incoming=missiles_incoming,
@@ -220,21 +210,11 @@ class MissileCombat(CombatResolver):
         airbase
     ) -> dict:
         """Calculate specific damage to airbase components."""
-        damage_distribution = {
-            "runway": 0.4,
-            "fuel": 0.2,
-            "ammo": 0.15,
-            "shelters": 0.15,
-            "maintenance": 0.1,
+        return {
+            component: damage * fraction * self.roll(1.0, 0.3)
+            for component, fraction in self.AIRBASE_DAMAGE_DISTRIBUTION.items()
         }
 
-        results = {}
-        for component, fraction in damage_distribution.items():
-            component_damage = damage * fraction * self.roll(1.0, 0.3)
-            results[component] = component_damage
-
-        return results
-
     def apply_airbase_damage(self, airbase, damage_dict: dict):
         """Apply damage to airbase components."""
         if "runway" in damage_dict:
@@ -14,7 +14,7 @@ from typing import Optional
 from .base import CombatResolver, CombatReport, CombatResult
 
 
-@dataclass
+@dataclass(slots=True)
 class SFMission:
     """A special forces mission."""
     unit_id: str
@@ -26,7 +26,7 @@ class SFMission:
     extraction_planned: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SFResult:
     """Result of special forces operation."""
     mission_success: bool
@@ -327,26 +327,33 @@ class SpecialForcesCombat(CombatResolver):
 
         compromised = False
 
+        draw = self.rng.random
+        roll = self.roll
+        identified = intel["units_identified"]
+        positions = intel["positions"]
+        estimates = intel["strength_estimates"]  # Keyed by identified unit id
+        exposure_chance = 0.1 * (1.0 - stealth / 200.0)
+        detect_chance = (skill / 100.0) * 0.5  # 50% per turn
+
         # Each turn of observation
         for turn in range(observation_time_turns):
             # Risk of detection each turn
-            if self.hit_check(0.1 * (1.0 - stealth / 200.0)):
+            if draw() < exposure_chance:
                 compromised = True
                 break
 
             # Gather intel on units
             for unit in target_area_units:
-                if unit.id not in intel["units_identified"]:
-                    detect_chance = (skill / 100.0) * 0.5  # 50% per turn
-                    if self.hit_check(detect_chance):
-                        intel["units_identified"].append(unit.id)
-                        intel["positions"].append({
+                if unit.id not in estimates:
+                    if draw() < detect_chance:
+                        identified.append(unit.id)
+                        positions.append({
                             "unit_id": unit.id,
                             "location": (unit.location.hex_q, unit.location.hex_r),
-                            "accuracy": self.roll(0.9, 0.1)
+                            "accuracy": roll(0.9, 0.1)
                         })
-                        intel["strength_estimates"][unit.id] = int(
-                            unit.state.strength_current * self.roll(1.0, 0.15)
+                        estimates[unit.id] = int(
+                            unit.state.strength_current * roll(1.0, 0.15)
                         )
 
         # Identify vulnerabilities
@@ -245,7 +245,7 @@ class CostTracker:
         turn_costs = TurnCosts()
 
         for report in reports:
-            r = report if isinstance(report, dict) else report.__dict__
+            r = report if isinstance(report, dict) else report.as_dict()
 
             attacker_id = r.get("attacker_id", "")
             defender_id = r.get("defender_id", "")
@@ -6,7 +6,7 @@ Each turn represents 6 hours. 16 turns = 4 days.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Iterator
 from enum import Enum
 import json
 import yaml
@@ -69,7 +69,7 @@ class GameState:
     turn_history: list[TurnState] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Orders:
     """Orders from an agent for a turn."""
     faction: str
@@ -84,6 +84,18 @@ class Orders:
     sf_missions: list = field(default_factory=list)
 
 
+def _split_air_missions(missions: list) -> tuple[list, list]:
+    """Partition air missions into (cap/sweep, strike/sead/cas), reading each type once."""
+    cap, strike = [], []
+    for m in missions:
+        mission_type = m.get("mission_type", m.get("type", ""))
+        if mission_type in ("cap", "sweep"):
+            cap.append(m)
+        elif mission_type in ("strike", "sead", "cas"):
+            strike.append(m)
+    return cap, strike
+
+
 class TurnManager:
     """Manages turn execution and phase sequencing."""
 
@@ -254,13 +266,26 @@ class TurnManager:
         pakistan_orders: Orders,
     ) -> TurnState:
         """Execute all phases of a turn."""
+        for _ in self.iter_full_turn(india_orders, pakistan_orders):
+            pass
+        return self.current_turn
+
+    def iter_full_turn(
+        self,
+        india_orders: Orders,
+        pakistan_orders: Orders,
+    ) -> Iterator[tuple[Phase, list]]:
+        """Execute a turn phase by phase, yielding (phase, reports) as each completes.
+
+        The turn is only ended (VP, economics, history) once the iterator is
+        exhausted; current_turn holds the accumulated TurnState afterwards.
+        """
         self.start_turn()
 
         for phase in self.PHASES:
-            self.execute_phase(phase, india_orders, pakistan_orders)
+            yield phase, self.execute_phase(phase, india_orders, pakistan_orders)
 
         self.end_turn()
-        return self.current_turn
 
     def end_turn(self):
         """End the current turn."""
@@ -387,7 +412,7 @@ class TurnManager:
         battery.fire_missile(missiles)
         report.turn = self.game_state.turn
 
-        return report.__dict__
+        return report.as_dict()
 
     def _get_sams_defending(self, target_id: str, faction: str) -> list:
         """Get SAM systems defending a target — layered defense.
@@ -525,7 +550,7 @@ class TurnManager:
                 "comms_degradation": effect.comms_degradation,
                 "radar_degradation": effect.radar_degradation,
             }
-            return effect_dict, report.__dict__
+            return effect_dict, report.as_dict()
 
         elif mission_type == "sigint":
             sigint_cap = mission.get("sigint_capability", 60.0)
@@ -551,7 +576,7 @@ class TurnManager:
                     )
                     self.fog.add_manual_intel(faction, intel_report)
             effect_dict = {"sigint_intel": effect.intel_gathered}
-            return effect_dict, report.__dict__
+            return effect_dict, report.as_dict()
 
         elif mission_type == "gps_denial":
             # GPS denial uses jamming resolver with GPS-specific effects
@@ -563,7 +588,7 @@ class TurnManager:
                 "gps_degradation": effect.gps_degradation,
                 "radar_degradation": effect.radar_degradation,
             }
-            return effect_dict, report.__dict__
+            return effect_dict, report.as_dict()
 
         else:
             # jam_radar, jam_comms — existing jamming code
@@ -574,7 +599,7 @@ class TurnManager:
             )
 
             report.turn = self.game_state.turn
-            report_dict = report.__dict__
+            report_dict = report.as_dict()
 
             effect_dict = {
                 "radar_degradation": effect.radar_degradation,
@@ -587,21 +612,21 @@ class TurnManager:
         """Execute air combat phase."""
         reports = []
 
-        india_air = india_orders.air_missions
-        pakistan_air = pakistan_orders.air_missions
-
         # Separate missions by type
-        india_cap = [m for m in india_air if m.get("mission_type", m.get("type", "")) in ("cap", "sweep")]
-        india_strike = [m for m in india_air if m.get("mission_type", m.get("type", "")) in ("strike", "sead", "cas")]
-        pakistan_cap = [m for m in pakistan_air if m.get("mission_type", m.get("type", "")) in ("cap", "sweep")]
-        pakistan_strike = [m for m in pakistan_air if m.get("mission_type", m.get("type", "")) in ("strike", "sead", "cas")]
+        india_cap, india_strike = _split_air_missions(india_orders.air_missions)
+        pakistan_cap, pakistan_strike = _split_air_missions(pakistan_orders.air_missions)
 
         # Phase 1: Air-to-air combat (CAP vs CAP/sweep)
+        # AWACS cover only changes between turns, so look it up once for all engagements
+        awacs = {}
+        if india_cap and pakistan_cap:
+            awacs = {faction: self._get_awacs_bonus(faction) for faction in ("india", "pakistan")}
+
         # Match up opposing CAP missions
         for i, india_mission in enumerate(india_cap):
             if i < len(pakistan_cap):
                 pak_mission = pakistan_cap[i]
-                report = self._resolve_air_to_air(india_mission, pak_mission, "india")
+                report = self._resolve_air_to_air(india_mission, pak_mission, "india", awacs)
                 if report:
                     reports.append(report)
             else:
@@ -648,8 +673,17 @@ class TurnManager:
                 return {"radar_boost": radar_boost, "bvr_extension": bvr_extension}
         return {}
 
-    def _resolve_air_to_air(self, attacker_mission: dict, defender_mission: dict, attacker_faction: str) -> Optional[dict]:
-        """Resolve air-to-air combat between two missions."""
+    def _resolve_air_to_air(
+        self,
+        attacker_mission: dict,
+        defender_mission: dict,
+        attacker_faction: str,
+        awacs: dict,
+    ) -> Optional[dict]:
+        """Resolve air-to-air combat between two missions.
+
+        awacs maps each faction to its _get_awacs_bonus() result.
+        """
         from .combat.air import AirMission
 
         att_sqn_id = attacker_mission.get("squadron_id", "")
@@ -684,14 +718,14 @@ class TurnManager:
         )
 
         # Apply AWACS cooperative engagement bonus to attacker
-        awacs = self._get_awacs_bonus(attacker_faction)
+        att_awacs = awacs[attacker_faction]
         att_stats = dict(att_squadron.type_data)
-        if awacs:
-            att_stats["radar"] = att_stats.get("radar", 70) * awacs.get("radar_boost", 1.0)
+        if att_awacs:
+            att_stats["radar"] = att_stats.get("radar", 70) * att_awacs.get("radar_boost", 1.0)
 
         # Apply AWACS bonus to defender
         def_faction = "pakistan" if attacker_faction == "india" else "india"
-        def_awacs = self._get_awacs_bonus(def_faction)
+        def_awacs = awacs[def_faction]
         def_stats = dict(def_squadron.type_data)
         if def_awacs:
             def_stats["radar"] = def_stats.get("radar", 70) * def_awacs.get("radar_boost", 1.0)
@@ -710,7 +744,7 @@ class TurnManager:
 
         report.turn = self.game_state.turn
         report.phase = "air_to_air"
-        return report.__dict__
+        return report.as_dict()
 
     def _create_cap_report(self, mission: dict, faction: str, contested: bool) -> Optional[dict]:
         """Create report for uncontested CAP mission."""
@@ -784,7 +818,7 @@ class TurnManager:
 
         report.turn = self.game_state.turn
         report.phase = f"air_{mission_type}"
-        return report.__dict__
+        return report.as_dict()
 
     def _execute_drone_phase(self, india_orders: Orders, pakistan_orders: Orders) -> list:
         """Execute drone operations phase."""
@@ -910,7 +944,7 @@ class TurnManager:
                 unit.take_losses(drones_lost, drones_lost * 3)
 
         report.turn = self.game_state.turn
-        return report.__dict__
+        return report.as_dict()
 
     def _get_ad_coverage_for_drones(self, target_id: str, faction: str) -> list:
         """Build AD coverage list from AIR_DEFENSE units of the given faction."""
@@ -1009,7 +1043,7 @@ class TurnManager:
         battery.consume_supply(combat=True)
 
         report.turn = self.game_state.turn
-        return report.__dict__
+        return report.as_dict()
 
     def _execute_helicopter_phase(self, india_orders: Orders, pakistan_orders: Orders) -> list:
         """Execute helicopter operations."""
@@ -1095,7 +1129,7 @@ class TurnManager:
             unit.take_losses(engagement.helicopters_lost, engagement.helicopters_lost * 5)
 
         report.turn = self.game_state.turn
-        return report.__dict__
+        return report.as_dict()
 
     def _execute_ground_phase(self, india_orders: Orders, pakistan_orders: Orders) -> list:
         """Execute ground combat phase."""
@@ -1150,7 +1184,7 @@ class TurnManager:
         self.current_turn.units_in_combat.add(defender.id)
 
         report.turn = self.game_state.turn
-        return report.__dict__
+        return report.as_dict()
 
     def _execute_sf_phase(self, india_orders: Orders, pakistan_orders: Orders) -> list:
         """Execute special forces phase."""
@@ -1259,7 +1293,7 @@ class TurnManager:
             unit.take_losses(result.casualties, result.casualties * 5)
 
         report.turn = self.game_state.turn
-        return report.__dict__
+        return report.as_dict()
 
     def _execute_logistics_phase(self) -> list:
         """Execute logistics phase."""
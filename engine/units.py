@@ -97,6 +97,8 @@ class Unit:
     subordinate_ids: list[str] = field(default_factory=list)
     orders: Optional[dict] = None  # Current orders from agent
     type_data: dict = field(default_factory=dict)  # Loaded type stats
+    # IDs of the faction's combat-effective units, shared with the UnitManager
+    effective_index: Optional[set[str]] = field(default=None, repr=False, compare=False)
 
     def is_combat_effective(self) -> bool:
         """Check if unit can still fight."""
@@ -156,6 +158,22 @@ class Unit:
         if self.state.strength_current <= 0:
             self.status = UnitStatus.DESTROYED
 
+        self._sync_effective_index()
+
+    def retreat(self):
+        """Order the unit to fall back; it stops being combat effective."""
+        self.status = UnitStatus.RETREATING
+        self._sync_effective_index()
+
+    def _sync_effective_index(self):
+        """Add or remove this unit from its faction's effective-unit index."""
+        if self.effective_index is None:
+            return
+        if self.is_combat_effective():
+            self.effective_index.add(self.id)
+        else:
+            self.effective_index.discard(self.id)
+
     def apply_suppression(self, amount: float):
         """Apply suppression from combat."""
         self.state.suppression = min(100, self.state.suppression + amount)
@@ -173,6 +191,8 @@ class Unit:
         if self.state.morale < 50:
             self.state.morale = min(50, self.state.morale + 3)
 
+        self._sync_effective_index()
+
     def consume_supply(self, combat: bool = False):
         """Consume supply for the turn."""
         base_consumption = 5 if not combat else 15
@@ -278,6 +298,11 @@ class UnitManager:
         self.units: dict[str, Unit] = {}
         self.airbases: dict[str, Airbase] = {}
         self.type_definitions: dict[str, dict] = {}
+        # Combat-effective unit IDs per faction, updated by the units themselves
+        self._effective_by_faction: dict[Faction, set[str]] = {faction: set() for faction in Faction}
+        # Units per faction / category; units are only added by load_faction_oob
+        self._by_faction: dict[Faction, list[Unit]] = {faction: [] for faction in Faction}
+        self._by_category: dict[UnitCategory, list[Unit]] = {category: [] for category in UnitCategory}
 
         self._load_type_definitions()
 
@@ -335,6 +360,25 @@ class UnitManager:
             if filepath.exists():
                 loader(filepath, faction)
 
+        self._index_units()
+        self._index_effective(faction)
+
+    def _index_units(self):
+        """Rebuild the per-faction and per-category unit lists."""
+        for units in (*self._by_faction.values(), *self._by_category.values()):
+            units.clear()
+        for unit in self.units.values():
+            self._by_faction[unit.faction].append(unit)
+            self._by_category[unit.category].append(unit)
+
+    def _index_effective(self, faction: Faction):
+        """Rebuild a faction's effective-unit index and attach it to its units."""
+        index = self._effective_by_faction[faction]
+        index.clear()
+        for unit in self.get_units_by_faction(faction):
+            unit.effective_index = index
+            unit._sync_effective_index()
+
     def _load_airbases(self, filepath: Path, faction: Faction):
         """Load airbases and squadrons."""
         with open(filepath) as f:
@@ -621,15 +665,19 @@ class UnitManager:
         return self.airbases.get(base_id)
 
     def get_units_by_faction(self, faction: Faction) -> list[Unit]:
-        return [u for u in self.units.values() if u.faction == faction]
+        return list(self._by_faction[faction])
 
     def get_units_by_category(self, category: UnitCategory) -> list[Unit]:
-        return [u for u in self.units.values() if u.category == category]
+        return list(self._by_category[category])
 
     def get_units_at_location(self, q: int, r: int) -> list[Unit]:
         return [u for u in self.units.values()
                 if u.location.hex_q == q and u.location.hex_r == r]
 
+    def count_effective(self, faction: Faction) -> int:
+        """Number of combat-effective units of a faction (O(1), index-backed)."""
+        return len(self._effective_by_faction[faction])
+
     def get_combat_effective_units(self, faction: Faction) -> list[Unit]:
         return [u for u in self.units.values()
                 if u.faction == faction and u.is_combat_effective()]
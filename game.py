@@ -6,6 +6,7 @@ Orchestrates the simulation between two LLM agents.
 
 import os
 import json
+import asyncio
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -24,6 +25,7 @@ from engine import (
     TurnManager, GameState, Orders, Faction
 )
 from agents import IndiaAgent, PakistanAgent
+from agents.client import aclose_async_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -113,7 +115,7 @@ class WargameSimulation:
         # TODO: Apply initial deployments from scenario
         logger.info(f"Scenario loaded: {scenario.get('scenario', {}).get('name', 'Unknown')}")
 
-    def run_turn(self) -> dict:
+    async def run_turn(self) -> dict:
         """Run a single turn of the simulation."""
         turn = self.turn_manager.game_state.turn + 1
         logger.info(f"\n{'='*60}")
@@ -133,25 +135,33 @@ class WargameSimulation:
         india_reasoning = ""
         pakistan_reasoning = ""
 
-        # India generates orders
-        logger.info("India generating orders...")
-        try:
-            india_orders = self.india_agent.generate_orders(india_state, previous_reports)
+        # Both agents plan concurrently: they only read pre-turn state
+        logger.info("India and Pakistan generating orders...")
+        india_result, pakistan_result = await asyncio.gather(
+            self.india_agent.agenerate_orders(india_state, previous_reports),
+            self.pakistan_agent.agenerate_orders(pakistan_state, previous_reports),
+            return_exceptions=True,
+        )
+        # A cancelled agent call cancels the turn; it is not an agent failure
+        for result in (india_result, pakistan_result):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+
+        if isinstance(india_result, BaseException):
+            logger.error(f"India agent error: {india_result}")
+            india_orders = Orders(faction="india", turn=turn)
+        else:
+            india_orders = india_result
             india_reasoning = self.india_agent.get_reasoning() or ""
             logger.info(f"India reasoning: {india_reasoning[:200]}..." if india_reasoning else "No reasoning")
-        except Exception as e:
-            logger.error(f"India agent error: {e}")
-            india_orders = Orders(faction="india", turn=turn)
 
-        # Pakistan generates orders
-        logger.info("Pakistan generating orders...")
-        try:
-            pakistan_orders = self.pakistan_agent.generate_orders(pakistan_state, previous_reports)
+        if isinstance(pakistan_result, BaseException):
+            logger.error(f"Pakistan agent error: {pakistan_result}")
+            pakistan_orders = Orders(faction="pakistan", turn=turn)
+        else:
+            pakistan_orders = pakistan_result
             pakistan_reasoning = self.pakistan_agent.get_reasoning() or ""
             logger.info(f"Pakistan reasoning: {pakistan_reasoning[:200]}..." if pakistan_reasoning else "No reasoning")
-        except Exception as e:
-            logger.error(f"Pakistan agent error: {e}")
-            pakistan_orders = Orders(faction="pakistan", turn=turn)
 
         # Store for replay collector
         self._last_india_orders = india_orders
@@ -211,20 +221,7 @@ class WargameSimulation:
         replay.snapshot_initial_state()
 
         max_turns = max_turns or self.turn_manager.game_state.max_turns
-
-        while (self.turn_manager.game_state.turn < max_turns and
-               not self.turn_manager.game_state.game_over):
-            self.run_turn()
-
-            # Snapshot for replay
-            turn_state = self.turn_manager.game_state.turn_history[-1]
-            replay.snapshot_turn(
-                turn_state,
-                self._last_india_orders,
-                self._last_pakistan_orders,
-                self._last_india_reasoning,
-                self._last_pakistan_reasoning,
-            )
+        asyncio.run(self._play_turns(max_turns, replay))
 
         # Final results
         results = self._compile_results()
@@ -238,6 +235,26 @@ class WargameSimulation:
 
         return results
 
+    async def _play_turns(self, max_turns: int, replay):
+        """Play turns on a single event loop until the game ends."""
+        try:
+            while (self.turn_manager.game_state.turn < max_turns and
+                   not self.turn_manager.game_state.game_over):
+                await self.run_turn()
+
+                # Snapshot for replay
+                turn_state = self.turn_manager.game_state.turn_history[-1]
+                replay.snapshot_turn(
+                    turn_state,
+                    self._last_india_orders,
+                    self._last_pakistan_orders,
+                    self._last_india_reasoning,
+                    self._last_pakistan_reasoning,
+                )
+        finally:
+            # The async client's pool is bound to this loop; close it with the loop
+            await aclose_async_client()
+
     def _compile_results(self) -> dict:
         """Compile final game results."""
         game = self.turn_manager.game_state
@@ -210,7 +210,7 @@ class ReplayCollector:
                       india_reasoning, pakistan_reasoning):
         events = []
         for report in turn_state.combat_reports:
-            r = report if isinstance(report, dict) else report.__dict__
+            r = report if isinstance(report, dict) else report.as_dict()
 
             # Resolve target/event location
             to_lat, to_lon = None, None
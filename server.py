@@ -292,7 +292,7 @@ class GameSession:
         """Build turn result data (same pattern as ReplayCollector.snapshot_turn)."""
         events = []
         for report in turn_state.combat_reports:
-            r = report if isinstance(report, dict) else report.__dict__
+            r = report if isinstance(report, dict) else report.as_dict()
 
             to_lat, to_lon = None, None
             loc = r.get("location")
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Offline tests of engine and agent internals - no API key or network needed.
+
+Run directly (python test_offline.py) or with pytest. Agents get a dummy
+OPENAI_API_KEY and stub clients, so no request ever leaves the process.
+"""
+
+import os
+import asyncio
+import tempfile
+import traceback
+from pathlib import Path
+from types import SimpleNamespace
+
+# Agents build an OpenAI client on construction; it is never used here
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline-test")
+
+from engine import UnitManager, Faction
+from engine.combat.base import CombatResolver, CombatResult
+from engine.turn import Orders
+from agents import IndiaAgent
+from agents.base import AgentConfig
+from agents.cache import SemanticOrdersCache, ResponseCache
+
+DATA_PATH = Path(__file__).parent / "data"
+
+
+def _unit(unit_id, strength=100, status="ready"):
+    return {"id": unit_id, "type": "infantry_bde", "location": (10, 10),
+            "strength": strength, "status": status, "supply": 90}
+
+
+def _state(turn, own_units, known_enemies=(), vp=(0, 0)):
+    return {
+        "turn": turn, "day": 1, "time_of_day": "dawn", "weather": "clear",
+        "own_units": list(own_units), "known_enemies": list(known_enemies),
+        "suspected_enemies": [], "supply_status": {},
+        "vp": {"india": vp[0], "pakistan": vp[1]},
+    }
+
+
+def test_diff_state():
+    """Delta briefing: lost, new and changed units, new contacts, VP"""
+    agent = IndiaAgent.create_default()
+    assert agent._diff_state(_state(1, [_unit("a"), _unit("b"), _unit("c")])) is None
+
+    diff = agent._diff_state(_state(
+        2,
+        [_unit("a", strength=60), _unit("c"), _unit("d")],
+        known_enemies=[{"id": "e1", "type": "armoured_bde"}],
+        vp=(5, -2),
+    ))
+    assert [u["id"] for u in diff["lost_units"]] == ["b"]
+    assert [u["id"] for u in diff["new_units"]] == ["d"]
+    assert [(u["id"], before["strength"]) for u, before in diff["strength_changes"]] == [("a", 100)]
+    assert [e["id"] for e in diff["new_contacts"]] == ["e1"]
+    assert diff["vp_delta"] == {"india": 5, "pakistan": -2}
+
+    # A contact already reported is not new; an unchanged roster has no deltas
+    diff = agent._diff_state(_state(
+        3, [_unit("a", strength=60), _unit("c"), _unit("d")],
+        known_enemies=[{"id": "e1"}], vp=(5, -2),
+    ))
+    assert not any(diff[k] for k in ("lost_units", "new_units", "strength_changes", "new_contacts"))
+    assert diff["vp_delta"] == {"india": 0, "pakistan": 0}
+
+
+def test_delta_briefing_lists_new_units():
+    """Delta briefing renders reinforcements between full rosters"""
+    agent = IndiaAgent.create_default()
+    agent.turn_count = 1
+    agent._build_situation_prompt(_state(1, [_unit("a")]))
+    agent.turn_count = 2
+    prompt = agent._build_situation_prompt(_state(2, [_unit("a"), _unit("reinf_1")]))
+    assert "CHANGES SINCE LAST TURN" in prompt
+    assert "**New** (1)" in prompt
+    assert "`reinf_1`" in prompt
+
+
+def _embedding_client(vectors):
+    """Stub client whose embeddings.create returns vectors[text]."""
+    def create(model, input):
+        return SimpleNamespace(data=[SimpleNamespace(embedding=vectors[input])])
+    return SimpleNamespace(embeddings=SimpleNamespace(create=create))
+
+
+def test_semantic_cache():
+    """Semantic cache: hit above threshold, miss below, best match wins"""
+    client = _embedding_client({
+        "turn 1": [1.0, 0.0, 0.0],
+        "turn 1 again": [0.99, 0.1, 0.0],
+        "turn 2": [0.8, 0.6, 0.0],
+        "elsewhere": [0.0, 0.0, 3.0],
+    })
+    cache = SemanticOrdersCache(threshold=0.9)
+    assert cache.lookup(cache.embed(client, "turn 1")) is None  # empty cache
+
+    cache.add(cache.embed(client, "turn 1"), "orders-1")
+    cache.add(cache.embed(client, "turn 2"), "orders-2")
+    assert len(cache) == 2
+    assert cache.lookup(cache.embed(client, "turn 1 again")) == "orders-1"
+    assert cache.lookup(cache.embed(client, "elsewhere")) is None
+    # A looser threshold matches the closest entry, not the first one
+    assert cache.lookup(cache.embed(client, "turn 2"), threshold=0.5) == "orders-2"
+
+
+def test_response_cache():
+    """Response cache: stable keys, hit, miss and LRU eviction to disk"""
+    state = {"turn": 1, "own_units": [_unit("a")], "vp": {"india": 0, "pakistan": 0}}
+    reordered = {"vp": {"pakistan": 0, "india": 0}, "own_units": [_unit("a")], "turn": 1}
+    assert ResponseCache.key("doctrine", state) == ResponseCache.key("doctrine", reordered)
+    assert ResponseCache.key("doctrine", state) != ResponseCache.key("doctrine", state, [{"phase": "air"}])
+    assert ResponseCache.key("doctrine", state) != ResponseCache.key("other doctrine", state)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache(path=tmp, maxsize=2)
+        assert cache.get("k1") is None
+        for key in ("k1", "k2", "k3"):
+            cache.put(key, f"orders-{key}")
+        # k1 was least recently used, so it left memory but not disk
+        assert list(cache.entries) == ["k2", "k3"]
+        assert cache.get("k2") == "orders-k2"
+        assert cache.get("k1") == "orders-k1"
+        assert list(cache.entries) == ["k2", "k1"]
+
+        # A fresh cache over the same directory serves persisted entries
+        assert ResponseCache(path=tmp).get("k3") == "orders-k3"
+
+
+def _summary_client(calls):
+    def create(**request):
+        calls.append(request)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="summary"))])
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+def test_history_compaction():
+    """History compaction keeps the last history_keep_turns turns"""
+    keep_turns = 2
+    agent = IndiaAgent(AgentConfig(faction="india", doctrine="offensive", history_keep_turns=keep_turns))
+    calls = []
+    agent.client = _summary_client(calls)
+    turn = lambda n: [{"role": "user", "content": f"brief {n}"}, {"role": "assistant", "content": f"orders {n}"}]
+
+    # Up to twice history_keep_turns turns are kept verbatim
+    agent.conversation_history = [m for n in range(2 * keep_turns) for m in turn(n)]
+    agent._fold_history()
+    assert not calls and len(agent.conversation_history) == 4 * keep_turns
+
+    agent.conversation_history += turn(2 * keep_turns)
+    history = list(agent.conversation_history)
+    agent._fold_history()
+    assert len(calls) == 1
+    assert agent.conversation_history[0] == {"role": "system", "content": "PRIOR TURNS SUMMARY:\nsummary"}
+    assert agent.conversation_history[1:] == history[-2 * keep_turns:]
+
+
+def _assert_index_matches_scan(units, faction):
+    scanned = {u.id for u in units.get_combat_effective_units(faction)}
+    assert units.count_effective(faction) == len(scanned)
+    assert units.get_units_by_faction(faction)[0].effective_index == scanned
+
+
+def test_effective_index():
+    """Effective-unit index matches a full scan after losses, retreat and recovery"""
+    units = UnitManager(DATA_PATH)
+    units.load_faction_oob(Faction.INDIA)
+    units.load_faction_oob(Faction.PAKISTAN)
+    for faction in (Faction.INDIA, Faction.PAKISTAN):
+        _assert_index_matches_scan(units, faction)
+
+    destroyed, disorganized, retreating = units.get_units_by_faction(Faction.INDIA)[:3]
+    destroyed.take_losses(destroyed.state.strength_current)
+    _assert_index_matches_scan(units, Faction.INDIA)
+
+    # Organization just under the effectiveness floor, then recovered above it
+    disorganized.take_losses(0, organization_loss=disorganized.state.organization - 17)
+    assert not disorganized.is_combat_effective()
+    _assert_index_matches_scan(units, Faction.INDIA)
+    disorganized.recover(disorganized.state.last_combat_turn + 2)
+    assert disorganized.is_combat_effective()
+    _assert_index_matches_scan(units, Faction.INDIA)
+
+    retreating.retreat()
+    retreating.recover(retreating.state.last_combat_turn + 2)
+    _assert_index_matches_scan(units, Faction.INDIA)
+    _assert_index_matches_scan(units, Faction.PAKISTAN)
+
+
+def test_hit_count():
+    """hit_count stays within bounds and matches the binomial mean"""
+    resolver = CombatResolver(rng_seed=7)
+    assert resolver.hit_count(0, 0.5) == 0
+    assert resolver.hit_count(25, 0.0) == 0
+    assert resolver.hit_count(25, 1.0) == 25
+
+    shots, chance, trials = 10, 0.3, 20000
+    counts = [resolver.hit_count(shots, chance) for _ in range(trials)]
+    assert min(counts) >= 0 and max(counts) <= shots
+    assert abs(sum(counts) / trials - shots * chance) < 0.05
+
+
+def _strike_ladder(effectiveness, any_hits):
+    """The if-chain strike_result replaced."""
+    if effectiveness >= 1.5:
+        return CombatResult.DECISIVE_VICTORY
+    if effectiveness >= 1.0:
+        return CombatResult.VICTORY
+    if effectiveness >= 0.5:
+        return CombatResult.MARGINAL
+    return CombatResult.STALEMATE if any_hits else CombatResult.DEFEAT
+
+
+def _sead_ladder(sam_damage):
+    """The if-chain sead_result replaced."""
+    if sam_damage >= 80:
+        return CombatResult.DECISIVE_VICTORY
+    if sam_damage >= 50:
+        return CombatResult.VICTORY
+    if sam_damage >= 25:
+        return CombatResult.MARGINAL
+    return CombatResult.STALEMATE
+
+
+def test_result_ladders():
+    """Strike and SEAD result tables match the original ladders at every threshold"""
+    resolver = CombatResolver(rng_seed=0)
+    for effectiveness in (0.0, 0.25, 0.4999, 0.5, 0.75, 0.9999, 1.0, 1.25, 1.4999, 1.5, 4.0):
+        for any_hits in (False, True):
+            assert resolver.strike_result(effectiveness, any_hits) == _strike_ladder(effectiveness, any_hits), \
+                (effectiveness, any_hits)
+    for sam_damage in (0.0, 24.99, 25.0, 40.0, 49.99, 50.0, 79.99, 80.0, 200.0):
+        assert resolver.sead_result(sam_damage) == _sead_ladder(sam_damage), sam_damage
+
+
+class _StubAgent:
+    """Agent stand-in: returns empty orders for the next turn, or raises."""
+
+    def __init__(self, faction, error=None):
+        self.faction = faction
+        self.error = error
+
+    async def agenerate_orders(self, game_state, previous_reports=None):
+        if self.error is not None:
+            raise self.error
+        return Orders(faction=self.faction, turn=game_state["turn"] + 1)
+
+    def get_reasoning(self):
+        return f"{self.faction} reasoning"
+
+
+def test_run_turn_failing_agent():
+    """A failing agent holds for the turn; a cancelled one cancels the turn"""
+    from game import WargameSimulation
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sim = WargameSimulation(data_path=str(DATA_PATH), log_dir=tmp)
+        sim.initialize()
+        sim.india_agent = _StubAgent("india")
+        sim.pakistan_agent = _StubAgent("pakistan", error=RuntimeError("model unavailable"))
+
+        turn_log = asyncio.run(sim.run_turn())
+        assert turn_log["turn"] == 1
+        assert turn_log["india_reasoning"] == "india reasoning"
+        assert turn_log["pakistan_reasoning"] == ""
+        assert sim._last_pakistan_orders.faction == "pakistan"
+        assert not any(turn_log["pakistan_orders_summary"].values())
+
+        sim.pakistan_agent = _StubAgent("pakistan", error=asyncio.CancelledError())
+        try:
+            asyncio.run(sim.run_turn())
+        except asyncio.CancelledError:
+            pass
+        else:
+            raise AssertionError("cancelled agent call did not cancel the turn")
+
+
+TESTS = [
+    test_diff_state,
+    test_delta_briefing_lists_new_units,
+    test_semantic_cache,
+    test_response_cache,
+    test_history_compaction,
+    test_effective_index,
+    test_hit_count,
+    test_result_ladders,
+    test_run_turn_failing_agent,
+]
+
+
+if __name__ == "__main__":
+    failed = 0
+    for i, test in enumerate(TESTS, 1):
+        print(f"\n{i}. {test.__doc__}...")
+        try:
+            test()
+            print("   ✓ OK")
+        except Exception as e:
+            failed += 1
+            print(f"   ✗ Failed: {e!r}")
+            traceback.print_exc()
+
+    print("\n" + "="*50)
+    print("TEST COMPLETE" if not failed else f"{failed} TEST(S) FAILED")
+    print("="*50)
+    exit(1 if failed else 0)